@@ -2,14 +2,29 @@
 Link extraction module for web crawling.
 """
 import logging
-from typing import List, Optional, Set
+import re
+from typing import Iterator, List, Optional, Set
 from urllib.parse import urldefrag, urljoin
 
+from lxml import etree
+from parsel.csstranslator import css2xpath
+
 from burmese_movies_crawler.utils.exceptions import ExtractionError
 from burmese_movies_crawler.utils.link_utils import is_valid_link
+from burmese_movies_crawler.utils.selector_utils import get_root
 
 logger = logging.getLogger(__name__)
 
+# Every anchor on the page. Movie-card anchors (div.item, div.card, article, ...)
+# are a subset of these, and an XPath union returns nodes in document order anyway,
+# so querying the card containers separately only added traversals.
+LINK_SELECTOR = 'a::attr(href)'
+
+# Absolute http(s) URLs that urljoin and urldefrag return unchanged: printable
+# ASCII with a host and no query, fragment, params or IPv6 brackets to re-parse
+ABSOLUTE_URL_RE = re.compile(
+    r'https?://[^\x00-\x20\x7f-\U0010ffff/?#;\[\]]+[^\x00-\x20\x7f-\U0010ffff?#;\[\]]*\Z')
+
 
 class LinkExtractor:
     """
@@ -24,6 +39,8 @@ class LinkExtractor:
             invalid_links: List of invalid link patterns to exclude
         """
         self.invalid_links = invalid_links if invalid_links is not None else []
+        # Translated and compiled once
+        self._links_xpath = etree.XPath(css2xpath(LINK_SELECTOR), smart_strings=False)
     
     def extract(self, response) -> List[str]:
         """
@@ -35,6 +52,26 @@ class LinkExtractor:
         Returns:
             List of normalized, valid URLs
             
+        Raises:
+            ExtractionError: If an error occurs during link extraction
+        """
+        unique_links = list(self.iter_links(response))
+        logger.info(f"Extracted {len(unique_links)} valid links after filtering.")
+        return unique_links
+
+    def iter_links(self, response) -> Iterator[str]:
+        """
+        Yield normalized, valid URLs from a response in document order.
+        
+        Links are normalized and validated lazily, so a caller that only
+        follows the first few (e.g. through itertools.islice) skips the rest.
+        
+        Args:
+            response: Scrapy response object
+            
+        Yields:
+            Normalized, valid URLs, each at most once
+            
         Raises:
             ExtractionError: If an error occurs during link extraction
         """
@@ -43,21 +80,16 @@ class LinkExtractor:
                 logger.error("No response object provided")
                 raise ExtractionError("No response object provided")
 
-            combined_selector = (
-                'div.item a::attr(href), div.card a::attr(href), div.movie a::attr(href), '
-                'div.movie-entry a::attr(href), div.movie-card a::attr(href), article a::attr(href)'
-            )
-
             try:
-                # Always combine specific and generic selectors
-                primary = response.css(combined_selector).getall()
-                fallback = response.css('a::attr(href)').getall()
-                links = list(set(primary) | set(fallback))
+                # Single tree walk over the precompiled selector
+                links = self._links_xpath(get_root(response))
             except Exception as e:
                 logger.error(f"Failed to extract links with CSS selector: {str(e)}")
                 raise ExtractionError(f"CSS selector error: {str(e)}") from e
 
-            unique_links: Set[str] = set()
+            # Deduplicate while streaming, preserving document order
+            seen: Set[str] = set()
+            page_url = None
             for link in links:
                 try:
                     if not isinstance(link, str):
@@ -65,18 +97,29 @@ class LinkExtractor:
 
                     raw = link.strip()
 
-                    # Normalize before validation
-                    resolved = urljoin(response.url, raw)
-                    clean = urldefrag(resolved)[0]
+                    # Normalize before validation. Plain absolute URLs are already
+                    # normalized, and every fragment-only link resolves to this page
+                    if ABSOLUTE_URL_RE.match(raw):
+                        clean = raw
+                    elif raw.startswith('#'):
+                        if page_url is None:
+                            page_url = urldefrag(urljoin(response.url, '#'))[0]
+                        clean = page_url
+                    else:
+                        resolved = urljoin(response.url, raw)
+                        clean = urldefrag(resolved)[0]
 
-                    if is_valid_link(clean, self.invalid_links):
-                        unique_links.add(clean)
+                    if clean in seen or not is_valid_link(clean, self.invalid_links):
+                        continue
 
                 except Exception as e:
                     logger.warning(f"Error processing link '{link}': {str(e)}")
+                    continue
 
-            logger.info(f"Extracted {len(unique_links)} valid links after filtering.")
-            return list(unique_links)
+                # Yield outside the per-link handler so errors raised in the
+                # caller aren't logged as link processing errors
+                seen.add(clean)
+                yield clean
 
         except Exception as e:
             if not isinstance(e, ExtractionError):
@@ -1,14 +1,77 @@
 """
 Main field extraction module for web content.
 """
+import functools
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, Optional, Sequence, Tuple
+
+from lxml import etree
+from parsel.csstranslator import css2xpath
 
 from burmese_movies_crawler.utils.exceptions import ExtractionError
+from burmese_movies_crawler.utils.selector_utils import get_root
 from burmese_movies_crawler.utils.text_cleaner import TextCleaner
 
 logger = logging.getLogger(__name__)
 
+# Candidate selectors per field, most specific first
+FIELD_SELECTORS = {
+    'title': ['h1.entry-title::text', 'h1.title::text', 'div.movie-title::text'],
+    'year': ['.ytps::text', 'span[class*="year"]::text'],
+    'poster_url': ['div.entry-content img::attr(src)'],
+    'streaming_link': ['iframe::attr(src)']
+}
+
+
+@functools.lru_cache(maxsize=128)
+def compile_selectors(selectors: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Translate a prioritized CSS selector list into XPath queries once.
+
+    Args:
+        selectors: Tuple of CSS selectors, optionally with ::text or ::attr()
+
+    Returns:
+        Tuple of (primary, fallback) XPath strings, both in selector priority
+        order. Selectors without ::text or ::attr() get a direct-text and a
+        nested-text query. Each fallback returns the string value of the first
+        element a selector matches; attribute selectors get no fallback, since
+        an element's text is never a substitute for a missing attribute.
+    """
+    primary = []
+    fallback = []
+    for sel in selectors:
+        if "::text" not in sel and "::attr" not in sel:
+            # For selectors without ::text, take direct and then nested text
+            primary.append(css2xpath(f"{sel}::text"))
+            primary.append(css2xpath(f"{sel} *::text"))
+        else:
+            primary.append(css2xpath(sel))
+
+        # Base selector without ::text for the string() fallback
+        if "::attr" not in sel:
+            base_sel = sel.split("::")[0] if "::" in sel else sel
+            fallback.append(f"string({css2xpath(base_sel)})")
+    return tuple(primary), tuple(fallback)
+
+
+@functools.lru_cache(maxsize=128)
+def compile_xpaths(selectors: Tuple[str, ...]) -> Tuple[Tuple[etree.XPath, ...], Tuple[etree.XPath, ...]]:
+    """
+    Compile the queries from compile_selectors into reusable XPath objects.
+
+    Args:
+        selectors: Tuple of CSS selectors, optionally with ::text or ::attr()
+
+    Returns:
+        Tuple of (primary, fallback) compiled XPath objects in priority order
+    """
+    primary, fallback = compile_selectors(selectors)
+    return (
+        tuple(etree.XPath(query, smart_strings=False) for query in primary),
+        tuple(etree.XPath(query) for query in fallback),
+    )
+
 
 class MainFieldExtractor:
     """
@@ -23,6 +86,11 @@ class MainFieldExtractor:
             text_cleaner: The text cleaner to use for normalizing extracted text
         """
         self.text_cleaner = text_cleaner
+        # Compiled once here so each response only evaluates prepared queries
+        self._field_xpaths = {
+            field: compile_xpaths(tuple(selectors))
+            for field, selectors in FIELD_SELECTORS.items()
+        }
     
     def extract(self, response) -> Dict[str, str]:
         """
@@ -42,19 +110,11 @@ class MainFieldExtractor:
                 logger.error("No response object provided")
                 raise ExtractionError("No response object provided")
                 
-            # Define fields with prioritized selectors (most specific first)
-            fields = {
-                'title': ['h1.entry-title::text', 'h1.title::text', 'div.movie-title::text'],
-                'year': ['.ytps::text', 'span[class*="year"]::text'],
-                'poster_url': ['div.entry-content img::attr(src)'],
-                'streaming_link': ['iframe::attr(src)']
-            }
-            
             # Process all fields in a batch
             results = {}
-            for field, selectors in fields.items():
+            for field, compiled in self._field_xpaths.items():
                 try:
-                    value = self.extract_field_value(response, selectors)
+                    value = self._extract_compiled(response, compiled)
                     if value:
                         results[field] = value
                 except Exception as e:
@@ -69,7 +129,7 @@ class MainFieldExtractor:
                 raise ExtractionError(f"Failed to extract main fields: {str(e)}") from e
             raise
     
-    def extract_field_value(self, response, selectors: List[str]) -> Optional[str]:
+    def extract_field_value(self, response, selectors: Sequence[str]) -> Optional[str]:
         """
         Extract the first matching value from a list of selectors.
         
@@ -91,58 +151,46 @@ class MainFieldExtractor:
             if not selectors:
                 logger.warning("No selectors provided")
                 return None
-            
-            # Try each selector individually
-            for sel in selectors:
-                try:
-                    # Handle text extraction for nested elements
-                    if "::text" not in sel and "::attr" not in sel:
-                        # For selectors without ::text, add it to get direct text
-                        direct_text_sel = f"{sel}::text"
-                        value = response.css(direct_text_sel).get()
-                        if value and value.strip():
-                            return self.text_cleaner.clean(value)
-                            
-                        # If no direct text, try to get text from nested elements
-                        element_sel = sel
-                        nested_text = response.css(f"{element_sel} *::text").get()
-                        if nested_text and nested_text.strip():
-                            return self.text_cleaner.clean(nested_text)
-                    else:
-                        # For selectors with ::text or ::attr, use as is
-                        value = response.css(sel).get()
-                        if value and (isinstance(value, str) and value.strip()):
-                            return self.text_cleaner.clean(value)
-                            
-                except Exception as e:
-                    logger.warning(f"Error with selector '{sel}': {str(e)}")
-                    # Continue with next selector
-            
-            # If we get here, try one more approach with XPath for nested content
-            for sel in selectors:
-                try:
-                    # Extract the base selector without ::text or ::attr
-                    base_sel = sel.split("::")[0] if "::" in sel else sel
-                    
-                    # Use XPath to get all text nodes
-                    xpath_result = response.css(base_sel).xpath("string()").get()
-                    if xpath_result and xpath_result.strip():
-                        return self.text_cleaner.clean(xpath_result)
-                except Exception as e:
-                    logger.warning(f"Error with XPath fallback for '{sel}': {str(e)}")
-            
-            return None
+
+            return self._extract_compiled(response, compile_xpaths(tuple(selectors)))
             
         except Exception as e:
             if not isinstance(e, ExtractionError):
                 logger.error(f"Extract field value error: {str(e)}")
-                raise ExtractionError(f"Failed to extract field value: {str(e)}")
+                raise ExtractionError(f"Failed to extract field value: {str(e)}") from e
             raise
+
+    def _extract_compiled(self, response, compiled: Tuple[Tuple[etree.XPath, ...], Tuple[etree.XPath, ...]]) -> Optional[str]:
+        """
+        Evaluate a field's precompiled XPath queries in priority order.
+        
+        Args:
+            response: Scrapy response or parsel Selector
+            compiled: (primary, fallback) queries from compile_xpaths
             
-            return None
-            
-        except Exception as e:
-            if not isinstance(e, ExtractionError):
-                logger.error(f"Extract field value error: {str(e)}")
-                raise ExtractionError(f"Failed to extract field value: {str(e)}") from e
-            raise
\ No newline at end of file
+        Returns:
+            Extracted and cleaned text, or None if not found
+        """
+        primary, fallback = compiled
+
+        # The first match of each query is checked, most specific selector first
+        for query in primary:
+            try:
+                values = query(get_root(response))
+                if values and isinstance(values[0], str) and values[0].strip():
+                    return self.text_cleaner.clean(values[0])
+            except Exception as e:
+                logger.warning(f"Error with selector '{query.path}': {str(e)}")
+                # Continue with next selector
+
+        # If we get here, try one more approach with XPath for nested content
+        for query in fallback:
+            try:
+                xpath_result = query(get_root(response))
+                if xpath_result and xpath_result.strip():
+                    return self.text_cleaner.clean(xpath_result)
+            except Exception as e:
+                logger.warning(f"Error with XPath fallback for '{query.path}': {str(e)}")
+
+        logger.debug("No match for field selectors")
+        return None
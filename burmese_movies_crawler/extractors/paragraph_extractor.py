@@ -2,10 +2,14 @@
 Paragraph extraction module for web content.
 """
 import logging
-from typing import Dict, Set
+from typing import Dict, List, Set
+
+from lxml import etree
+from parsel.csstranslator import css2xpath
 
 from burmese_movies_crawler.utils.exceptions import ExtractionError, ProcessingError
 from burmese_movies_crawler.utils.field_matcher import FieldMatcher
+from burmese_movies_crawler.utils.selector_utils import get_root
 from burmese_movies_crawler.utils.text_cleaner import TextCleaner
 
 logger = logging.getLogger(__name__)
@@ -13,6 +17,9 @@ logger = logging.getLogger(__name__)
 # Default confidence threshold
 DEFAULT_THRESHOLD = 70
 
+# Paragraphs inside the post body
+PARAGRAPH_SELECTOR = 'div.entry-content p'
+
 
 class ParagraphExtractor:
     """
@@ -29,6 +36,10 @@ class ParagraphExtractor:
         """
         self.field_matcher = field_matcher
         self.text_cleaner = text_cleaner
+        # Compiled once here so each response only evaluates prepared queries
+        self._paragraphs_xpath = etree.XPath(css2xpath(PARAGRAPH_SELECTOR))
+        self._lines_xpath = etree.XPath('text()', smart_strings=False)
+        self._text_xpath = etree.XPath('string()', smart_strings=False)
     
     def extract(self, response) -> Dict[str, str]:
         """
@@ -55,50 +66,25 @@ class ParagraphExtractor:
             # We need to ensure that CSS errors are properly propagated
             # while still handling other types of errors gracefully
             try:
-                paragraphs = []
-                
-                # First attempt to get direct text content
-                paragraphs.extend(response.css('div.entry-content p::text').getall() or [])
-                
-                # Then try to get full paragraph content for paragraphs with HTML entities
-                p_elements = response.css('div.entry-content p')
-                if hasattr(p_elements, '__iter__'):  # Check if iterable
-                    for p in p_elements:
-                        try:
-                            text = ''.join(p.css('::text').getall()).strip()
-                            if text:  # Only add non-empty paragraphs
-                                paragraphs.append(text)
-                        except Exception as e:
-                            # Skip problematic paragraphs but log the error
-                            logger.warning(f"Error processing paragraph: {str(e)}")
-                            continue
-                            
+                paragraphs = self._collect_paragraphs(response)
             except Exception as e:
                 logger.error(f"Failed to extract paragraphs: {str(e)}")
                 raise ExtractionError(f"Failed to extract paragraphs: {str(e)}") from e
             
-            # Pre-filter: only process paragraphs that are likely to contain field data
-            # This avoids processing paragraphs that are too short or too long
-            filtered_paragraphs = []
+            # Single pass: length-filter and match each paragraph as it is seen.
+            # Paragraphs that are too short or too long are unlikely to hold field data.
             for p in paragraphs:
                 try:
-                    p_stripped = p.strip()
-                    if 5 <= len(p_stripped) <= 200:
-                        filtered_paragraphs.append(p_stripped)
-                except Exception as e:
-                    logger.warning(f"Error processing paragraph: {str(e)}")
-                    # Continue with next paragraph
-            
-            # Process paragraphs in batches
-            for clean in filtered_paragraphs:
-                try:
-                    # Use field matching
+                    clean = p.strip()
+                    if not 5 <= len(clean) <= 200:
+                        continue
+                    
                     field, score = self.field_matcher.match(clean)
                     if field and field not in used and score > DEFAULT_THRESHOLD:
                         data[field] = self.text_cleaner.clean(clean)
                         used.add(field)
                 except Exception as e:
-                    logger.warning(f"Error matching field for text '{clean[:30]}...': {str(e)}")
+                    logger.warning(f"Error processing paragraph: {str(e)}")
                     # Continue with next paragraph
                     
             return data
@@ -107,4 +93,26 @@ class ParagraphExtractor:
             if not isinstance(e, (ExtractionError, ProcessingError)):
                 logger.error(f"Paragraph extraction error: {str(e)}")
                 raise ProcessingError(f"Failed to process paragraphs: {str(e)}") from e
-            raise
\ No newline at end of file
+            raise
+    
+    def _collect_paragraphs(self, response) -> List[str]:
+        """
+        Collect candidate texts from the post-body paragraphs in one walk.
+        
+        Each paragraph yields its direct text nodes (one per <br>-separated
+        line) and its full string() text (nested tags and entities included).
+        All lines come first, then the full texts, and repeats are dropped.
+        
+        Args:
+            response: Scrapy response or parsel Selector
+            
+        Returns:
+            List of stripped, non-empty candidate texts
+        """
+        lines: List[str] = []
+        texts: List[str] = []
+        for p in self._paragraphs_xpath(get_root(response)):
+            lines.extend(self._lines_xpath(p))
+            texts.append(self._text_xpath(p))
+        # dict.fromkeys keeps the first occurrence of each text in order
+        return list(dict.fromkeys(t for t in (t.strip() for t in lines + texts) if t))
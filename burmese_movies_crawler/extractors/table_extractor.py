@@ -2,14 +2,44 @@
 Table extraction module for web content.
 """
 import logging
-from typing import Generator, Dict, List, Any
+from typing import Generator, Dict, List, Any, Optional, Tuple
+
+from lxml import etree
+from parsel.csstranslator import css2xpath
 
 from burmese_movies_crawler.items import BurmeseMoviesItem
 from burmese_movies_crawler.utils.exceptions import TableProcessingError
 from burmese_movies_crawler.utils.header_mapper import HeaderMapper
+from burmese_movies_crawler.utils.selector_utils import get_root
 
 logger = logging.getLogger(__name__)
 
+# Table selectors, translated and compiled once and evaluated on the table's lxml element.
+# Every row is collected in one walk; header and body rows are picked from it in Python.
+ROWS_XPATH = etree.XPath(css2xpath('tr'))
+HEADER_TEXT_XPATH = etree.XPath('th/text() | td/text()', smart_strings=False)
+CELLS_XPATH = etree.XPath(css2xpath('td'))
+CELL_TEXT_XPATH = etree.XPath(css2xpath('::text'), smart_strings=False)
+
+ITEM_FIELDS = frozenset(BurmeseMoviesItem.fields)
+
+
+def _in_section(row, tag: str, root) -> bool:
+    """Whether `row` sits inside a `tag` element (e.g. thead) within `root`."""
+    el = row.getparent()
+    while el is not None:
+        if el.tag == tag:
+            return True
+        if el is root:
+            return False
+        el = el.getparent()
+    return False
+
+
+def _is_first_row(row) -> bool:
+    """Whether `row` is the first element among its siblings (comments don't count)."""
+    return not any(isinstance(sib.tag, str) for sib in row.itersiblings(preceding=True))
+
 
 class TableExtractor:
     """
@@ -45,15 +75,25 @@ class TableExtractor:
                 logger.error("No response or table object provided")
                 raise TableProcessingError("No response or table object provided")
                 
+            # Walk the rows once; headers and data rows are both taken from it
+            try:
+                root = get_root(table)
+                all_rows = ROWS_XPATH(root)
+            except Exception as e:
+                logger.error(f"Failed to get table rows: {str(e)}")
+                raise TableProcessingError(f"Failed to get table rows: {str(e)}") from e
+
             # Extract headers once and validate
             headers = []
             try:
                 # First try to get headers from thead
-                headers = [h.strip() for h in table.css('thead th::text, thead td::text').getall()]
+                headers = [h.strip() for row in all_rows if _in_section(row, 'thead', root)
+                           for h in HEADER_TEXT_XPATH(row)]
                 
                 # If no headers found, try the first row
                 if not headers:
-                    headers = [h.strip() for h in table.css('tr:first-child th::text, tr:first-child td::text').getall()]
+                    headers = [h.strip() for row in all_rows if _is_first_row(row)
+                               for h in HEADER_TEXT_XPATH(row)]
             except Exception as e:
                 logger.error(f"Failed to extract table headers: {str(e)}")
                 raise TableProcessingError(f"Failed to extract table headers: {str(e)}") from e
@@ -65,37 +105,31 @@ class TableExtractor:
             # Map headers to fields
             try:
                 header_map = self.header_mapper.map(headers)
+                # Resolve each column's item field once per table instead of per cell
+                active_columns = self._active_columns(headers, header_map)
             except Exception as e:
                 logger.error(f"Failed to map headers: {str(e)}")
                 raise TableProcessingError(f"Failed to map headers: {str(e)}") from e
             
-            # Process rows
-            try:
-                # First try tbody rows
-                rows = table.css('tbody tr')
-                
-                # If no tbody or no rows in tbody, try all rows except the first one (which contains headers)
-                if not rows:
-                    all_rows = table.css('tr')
-                    if len(all_rows) > 1:  # Skip the header row
-                        rows = all_rows[1:]
-            except Exception as e:
-                logger.error(f"Failed to get table rows: {str(e)}")
-                raise TableProcessingError(f"Failed to get table rows: {str(e)}") from e
+            # First try tbody rows
+            rows = [row for row in all_rows if _in_section(row, 'tbody', root)]
+            
+            # If no tbody or no rows in tbody, try all rows except the first one (which contains headers)
+            if not rows and len(all_rows) > 1:
+                rows = all_rows[1:]
             
             for row in rows:
                 try:
-                    # Get all text from cells, including nested elements
-                    cell_texts = []
-                    for i, cell in enumerate(row.css('td')):
-                        # Get all text from this cell
-                        cell_text = ' '.join([t.strip() for t in cell.css('::text').getall() if t.strip()])
-                        cell_texts.append(cell_text)
+                    # Get all text from cells, including nested elements; each text
+                    # node is stripped once and blank ones dropped before joining
+                    cell_texts = [' '.join(filter(None, map(str.strip, CELL_TEXT_XPATH(cell))))
+                                  for cell in CELLS_XPATH(row)]
                     
                     # Handle partial matches gracefully
                     if any(cell_texts):  # At least one cell has content
-                        item = self._create_item(cell_texts, headers, header_map)
-                        if any(item.values()):
+                        item = self._create_item(cell_texts, headers, header_map, active_columns)
+                        # Only non-blank values are assigned, so any field set means content
+                        if item:
                             yield item
                             self.items_scraped += 1
                 except Exception as e:
@@ -108,25 +142,49 @@ class TableExtractor:
                 raise TableProcessingError(f"Failed to process table: {str(e)}") from e
             raise
     
-    def _create_item(self, cells: List[str], headers: List[str], header_map: Dict[str, str]) -> BurmeseMoviesItem:
+    @staticmethod
+    def _active_columns(headers: List[str], header_map: Dict[str, str]) -> List[Tuple[int, str]]:
+        """
+        Resolve the table columns that map to an item field.
+        
+        Args:
+            headers: List of header strings from the table
+            header_map: Dictionary mapping header strings to field names
+            
+        Returns:
+            (column index, item field name) pairs; unmapped columns are left out
+        """
+        active = []
+        for i, header in enumerate(headers):
+            field = header_map.get(header)
+            if field and field in ITEM_FIELDS:
+                active.append((i, field))
+        return active
+    
+    def _create_item(self, cells: List[str], headers: List[str], header_map: Dict[str, str],
+                     active_columns: Optional[List[Tuple[int, str]]] = None) -> BurmeseMoviesItem:
         """
         Create a BurmeseMoviesItem from table cells and header mapping.
         
         Args:
-            cells: List of cell values from a table row
+            cells: List of stripped cell values from a table row
             headers: List of header strings from the table
             header_map: Dictionary mapping header strings to field names
+            active_columns: Precomputed result of _active_columns for these headers
             
         Returns:
             BurmeseMoviesItem with mapped fields
         """
+        if active_columns is None:
+            active_columns = self._active_columns(headers, header_map)
         item = BurmeseMoviesItem()
         
-        # Map available cells to headers
-        for i, value in enumerate(cells):
-            if i < len(headers):
-                field = header_map.get(headers[i])
-                if field and field in item.fields and value.strip():  # Check if field exists in item and value is not empty
+        # Only mapped columns are visited; rows may be shorter than the header
+        n_cells = len(cells)
+        for i, field in active_columns:
+            if i < n_cells:
+                value = cells[i]
+                if value:  # Skip empty values; cells arrive already stripped
                     item[field] = value
         
-        return item
\ No newline at end of file
+        return item
@@ -8,14 +8,17 @@
 from itemadapter import ItemAdapter
 from burmese_movies_crawler.schema.item_schema import MovieItem
 import logging
+from pydantic import ValidationError
 from scrapy.exceptions import DropItem
 
 
 class BurmeseMoviesPipeline:
     def process_item(self, item, spider):
+        # Plain dict items are validated without a copy
+        data = item if isinstance(item, dict) else dict(item)
         try:
-            validated = MovieItem(**dict(item))
+            MovieItem.model_validate(data)
             return item
-        except Exception as e:
+        except ValidationError as e:
             spider.logger.warning(f"Dropping invalid item: {e}")
             raise DropItem("Validation failed")
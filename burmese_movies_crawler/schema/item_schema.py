@@ -1,52 +1,52 @@
-from pydantic import BaseModel, Field, field_validator, HttpUrl
-from typing import Optional, List, Union
+from pydantic import BaseModel, Field, field_validator, HttpUrl, StringConstraints
+from typing import Annotated, Optional, List, Union
 from datetime import datetime
+
+# Stripped and length-checked inside pydantic-core instead of a Python validator
+RequiredText = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+# Computed once per process rather than on every validated item
+MIN_YEAR = 1800
+MAX_YEAR = datetime.now().year + 5
+
+SYNOPSIS_MAX_LENGTH = 1000
+MISSING_SYNOPSIS = frozenset({"n/a", "not available", "no synopsis", ""})
+# Placeholder hrefs/srcs that mean "no link"; treated as missing before URL parsing
+MISSING_URLS = frozenset({"", "#"})
+
 class MovieItem(BaseModel):
-    title: str = Field(..., min_length=1)
-    year: int
-    director: str = Field(..., min_length=1)
+    title: RequiredText
+    year: int = Field(ge=MIN_YEAR, le=MAX_YEAR)
+    director: RequiredText
     cast: Optional[List[str]] = None
     genre: Optional[str] = None
-    synopsis: Optional[str] = Field(default=None, max_length=1000)
+    synopsis: Optional[str] = None
     poster_url: Optional[HttpUrl] = None
     streaming_link: Optional[HttpUrl] = None
 
-    @field_validator("year")
-    def year_must_be_reasonable(cls, v):
-        current_year = datetime.now().year
-        upper_bound = current_year + 5
-        if not (1800 <= v <= upper_bound):
-            raise ValueError(f"Year must be between 1800 and {upper_bound}")
-        return v
-
-
-    @field_validator("title", "director", mode="before")
-    def strip_text_fields(cls, v):
-        if isinstance(v, str):
-            return v.strip()
-        return v
-
     @field_validator("cast", mode="before")
     def split_and_strip_cast(cls, v: Union[str, List[str]]):
         if isinstance(v, str):
             # Convert comma-separated string
             v = v.split(",")
         if isinstance(v, list):
-            # Strip each entry and remove empty ones
-            return [name.strip() for name in v if isinstance(name, str) and name.strip()]
+            # Strip each entry once and remove empty ones
+            return [stripped for name in v if isinstance(name, str) and (stripped := name.strip())]
         return None
 
+    @field_validator("poster_url", "streaming_link", mode="before")
+    def placeholder_url_to_none(cls, v):
+        if isinstance(v, str) and v.strip() in MISSING_URLS:
+            return None
+        return v
+
     @field_validator("synopsis", mode="before")
     def clean_synopsis(cls, v):
         if isinstance(v, str):
+            # Length is checked before stripping, so padded text can't slip under the limit
+            if len(v) > SYNOPSIS_MAX_LENGTH:
+                raise ValueError(f"Synopsis too long (max {SYNOPSIS_MAX_LENGTH} characters)")
             v = v.strip()
-            if v.lower() in {"n/a", "not available", "no synopsis", ""}:
+            if v.lower() in MISSING_SYNOPSIS:
                 return None
         return v
-
-    @field_validator("synopsis", mode="before")
-    def check_synopsis_length(cls, v):
-        if v and isinstance(v, str) and len(v) > 1000:
-            raise ValueError("Synopsis too long (max 1000 characters)")
-        return v
-
@@ -3,12 +3,9 @@
 import scrapy
 import logging
 import os
-import json
 from datetime import datetime, timezone
-from selenium.webdriver.chrome.options import Options
-from fuzzywuzzy import process
 from scrapy import signals
-from burmese_movies_crawler.items import BurmeseMoviesItem, FIELD_SELECTORS
+from burmese_movies_crawler.items import BurmeseMoviesItem
 from burmese_movies_crawler.utils.orchestrator import handle_page
 from burmese_movies_crawler.utils.link_utils import (
     rule_link_heavy, rule_text_heavy,
@@ -17,8 +14,8 @@ from burmese_movies_crawler.utils.link_utils import (
 from burmese_movies_crawler.utils.selenium_manager import SeleniumManager
 from burmese_movies_crawler.utils.page_classifier import PageClassifier
 from burmese_movies_crawler.factory import create_extractor_engine
-from burmese_movies_crawler.utils.orchestrator import handle_page
 from burmese_movies_crawler.utils.link_utils import get_response_or_request
+from burmese_movies_crawler.utils.io_utils import save_json
 from burmese_movies_crawler.settings import MOCK_MODE
 
 logger = logging.getLogger(__name__)
@@ -48,7 +45,7 @@ class MoviesSpider(scrapy.Spider):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.driver = None
+        self.selenium_mgr = None
         self._setup_paths()
         self.start_time = None
         self.end_time = None
@@ -88,17 +85,17 @@ class MoviesSpider(scrapy.Spider):
         self.summary_file = os.path.join(self.output_dir, f"run_summary_{timestamp}.json")
 
     def open_spider(self, spider):
-        # start up Selenium via our manager
+        # Selenium is only needed for JS-rendered pages; the manager starts
+        # Chrome lazily on its first render() call, plain requests skip it
         if not MOCK_MODE:
-            self.selenium_mgr = SeleniumManager()
-            self.driver = self.selenium_mgr.__enter__()
+            self.selenium_mgr = SeleniumManager(
+                pool_size=self.settings.getint('SELENIUM_POOL_SIZE', 4))
             self.start_time = datetime.now(timezone.utc)
-            logger.info("Chrome Driver started.")
 
     def close_spider(self, spider, reason):
         # tear down Selenium
         if self.selenium_mgr:
-            self.selenium_mgr.__exit__(None, None, None)
+            self.selenium_mgr.close()
         # record end time and save summary
         self.end_time = datetime.now(timezone.utc)
         self._save_run_summary(reason)
@@ -107,16 +104,20 @@ class MoviesSpider(scrapy.Spider):
         if self.invalid_links:
             path = os.path.join(self.output_dir,
                                 f"invalid_links_{self.timestamp}.json")
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(self.invalid_links, f, indent=2, ensure_ascii=False)
+            save_json(self.invalid_links, path)
             logger.info(f"Saved {len(self.invalid_links)} invalid links to {path}")
 
     def _save_run_summary(self, reason):
+        start_time, end_time = self.start_time, self.end_time
+        start_iso = start_time.isoformat() if start_time else None
+        end_iso = end_time.isoformat() if end_time else None
+        runtime = (end_time - start_time).total_seconds() if start_time and end_time else None
+
         summary = {
             "spider_name": self.name,
-            "start_time": self.start_time.isoformat() if self.start_time else None,
-            "end_time": self.end_time.isoformat() if self.end_time else None,
-            "runtime_seconds": (self.end_time - self.start_time).total_seconds() if self.start_time else None,
+            "start_time": start_iso,
+            "end_time": end_iso,
+            "runtime_seconds": runtime,
             "items_scraped": self.items_scraped,
             "warnings": self.warnings,
             "errors": self.errors,
@@ -124,14 +125,13 @@ class MoviesSpider(scrapy.Spider):
             "log_file": self.log_file,
             "close_reason": reason
         }
-        with open(self.summary_file, "w", encoding="utf-8") as f:
-            json.dump(summary, f, indent=4, ensure_ascii=False)
+        save_json(summary, self.summary_file, indent=4)
         logger.info(f"Run summary saved to: {self.summary_file}")
 
     def parse(self, response):
-        logger.info(f"Parsing page: {response.url}")
+        logger.info("Parsing page: %s", response.url)
         try:
-            result = handle_page(response.text, response.url,
+            result = handle_page(response, response.url,
                                 self.classifier, self.extractor)
         except Exception as e:
             logger.exception(f"Failed to classify “{response.url}”: {e}")
@@ -139,11 +139,10 @@ class MoviesSpider(scrapy.Spider):
             return
 
         if result["type"] == "catalogue":
-            for link in result["links"]:
-                yield response.follow(link,
-                                    callback=self.parse,
-                                    meta={'source': 'catalogue'},
-                                    priority=10)
+            yield from response.follow_all(result["links"],
+                                           callback=self.parse,
+                                           meta={'source': 'catalogue'},
+                                           priority=10)
 
             # pagination
             if result.get("next_page"):
@@ -153,14 +152,15 @@ class MoviesSpider(scrapy.Spider):
                                     priority=5)
 
         elif result["type"] == "detail":
+            # Building the Item rejects keys it doesn't declare, e.g. the mapping's duration
             item = BurmeseMoviesItem(**result["item"])
             yield item
             self.items_scraped += 1
 
         else:
             # unknown gets retried through candidate_extractor fallback
-            for link in result.get("fallback_links", []):
-                yield response.follow(link, callback=self.parse)
+            yield from response.follow_all(result.get("fallback_links", []),
+                                           callback=self.parse)
 
 
     def evaluate_catalogue_rules(self, response, stats):
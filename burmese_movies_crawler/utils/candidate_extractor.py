@@ -1,33 +1,108 @@
-from bs4 import BeautifulSoup
+import html
+
+import lxml.html
+from lxml import etree
 
 BLACKLIST_KEYWORDS = ["login", "subscribe", "advertisement", "sponsored", "cookie"]
 
-def extract_candidate_blocks(page_source, max_candidates=5):
+# Structural blocks holding both an image and a link, evaluated in a single libxml2
+# traversal. Predicates short-circuit left to right, so the text of a block is only
+# materialized (once, in Python) for blocks that pass both descendant checks.
+CANDIDATE_BLOCK_XPATH = etree.XPath(
+    "//*[self::div or self::section or self::article][.//img][.//a]"
+)
+
+# Visible text of a block. Script, style and noscript contents aren't page text,
+# and inline JS mentioning e.g. "login" must not blacklist a content block.
+BLOCK_TEXT_XPATH = etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::noscript)]",
+    smart_strings=False,
+)
+
+# Parser for callers passing HTML strings (the orchestrator passes Scrapy's tree).
+# Skips building nodes the candidate heuristics never look at. Strings are parsed
+# as UTF-8 bytes, so an <?xml encoding=...?> declaration can't make lxml reject them.
+CANDIDATE_PARSER = lxml.html.HTMLParser(remove_comments=True, remove_pis=True, remove_blank_text=True,
+                                        encoding='utf-8')
+
+SNIPPET_MAX_CHARS = 1500
+
+
+def _serialize_truncated(el, limit):
     """
-    Extracts top candidate movie blocks from page HTML using structural and content heuristics.
-    Returns up to `max_candidates` HTML snippets (str).
+    Serialize `el` (without its tail) as HTML, stopping once `limit` characters are produced.
+
+    Equivalent to `etree.tostring(el, method='html')[:limit]`, but children past the
+    limit are never serialized, so large blocks don't allocate their full markup.
     """
-    soup = BeautifulSoup(page_source, 'html.parser')
+    if not isinstance(el.tag, str):
+        # Comments and processing instructions
+        return etree.tostring(el, encoding='unicode', method='html', with_tail=False)[:limit]
+
+    shallow = el.makeelement(el.tag, el.attrib)
+    shallow.text = el.text
+    head = etree.tostring(shallow, encoding='unicode', method='html')
+    close = f'</{el.tag}>'
+    if head.endswith(close):
+        head = head[:-len(close)]
+    else:
+        close = ''
+
+    parts = [head]
+    size = len(head)
+    for child in el:
+        if size >= limit:
+            break
+        chunk = _serialize_truncated(child, limit - size)
+        if child.tail:
+            chunk += html.escape(child.tail, quote=False)
+        parts.append(chunk)
+        size += len(chunk)
+    parts.append(close)
+    return ''.join(parts)[:limit]
+
+
+def _rank_candidate_blocks(page_source):
+    """Parse the page (unless already parsed) and return all candidate snippets ranked by text length."""
+    if isinstance(page_source, str):
+        try:
+            doc = lxml.html.fromstring(page_source.encode('utf-8'), parser=CANDIDATE_PARSER)
+        except etree.ParserError:
+            # Nothing but comments or whitespace
+            return ()
+    else:
+        doc = page_source
     raw_candidates = []
 
-    for tag in soup.select('div, section, article'):
-        has_img = tag.find('img') is not None
-        has_link = tag.find('a') is not None
-        block_text = tag.get_text(strip=True).lower()
+    for el in CANDIDATE_BLOCK_XPATH(doc):
+        block_text = ''.join(t.strip() for t in BLOCK_TEXT_XPATH(el)).lower()
 
         # Basic heuristics
-        if not (has_img and has_link and len(block_text) > 30):
+        if len(block_text) <= 30:
             continue
 
         # Filter out junk content
         if any(bad_word in block_text for bad_word in BLACKLIST_KEYWORDS):
             continue
 
-        snippet = str(tag)[:1500]  # Truncate to avoid overly large blocks
+        snippet = _serialize_truncated(el, SNIPPET_MAX_CHARS)  # Truncate to avoid overly large blocks
         raw_candidates.append((snippet, len(block_text)))  # Store with length for ranking
 
     # Rank by extracted text length
     ranked_candidates = sorted(raw_candidates, key=lambda x: x[1], reverse=True)
 
     # Return only HTML snippets (strip the length scores)
-    return [snippet for snippet, _ in ranked_candidates[:max_candidates]]
+    return tuple(snippet for snippet, _ in ranked_candidates)
+
+
+def extract_candidate_blocks(page_source, max_candidates=5):
+    """
+    Extracts top candidate movie blocks from page HTML using structural and content heuristics.
+    `page_source` is either the HTML string or an already-parsed lxml root
+    (e.g. `response.selector.root`), which skips a second parse of the page.
+    Returns up to `max_candidates` HTML snippets (str).
+    """
+    if not isinstance(page_source, etree._Element) and (not page_source or not page_source.strip()):
+        return []
+
+    return list(_rank_candidate_blocks(page_source)[:max_candidates])
@@ -5,12 +5,54 @@ import functools
 import logging
 from typing import Dict, Tuple, Optional, List
 
-from fuzzywuzzy import process
+from fuzzywuzzy import process, utils as fuzz_utils
 from burmese_movies_crawler.utils.exceptions import ProcessingError
 from burmese_movies_crawler.utils.field_mapper import FieldMapper
 
 logger = logging.getLogger(__name__)
 
+# extractOne's default WRatio scales every partial score by 0.6 once one processed
+# string is over 8x longer than the other, so such a label can't score above 60
+WRATIO_LONG_RATIO = 8
+WRATIO_LONG_MAX_SCORE = 60
+
+# Best possible extractOne score, e.g. for a text that is exactly one of the labels
+EXACT_SCORE = 100
+
+
+@functools.lru_cache(maxsize=1024)
+def _query_length(text: str) -> int:
+    """Length of `text` after extractOne's default processing of a query."""
+    return len(fuzz_utils.full_process(fuzz_utils.full_process(text), force_ascii=True))
+
+
+@functools.lru_cache(maxsize=1024)
+def _label_length(label: str) -> int:
+    """Length of `label` after extractOne's default processing of a choice."""
+    return len(fuzz_utils.full_process(label, force_ascii=True))
+
+
+def _can_reach(text_length: int, labels: List[str], threshold: int) -> bool:
+    """
+    Whether any label could score `threshold` against a query of `text_length`.
+
+    Lets match() skip fuzzy scoring for fields whose labels are all far shorter
+    than the text, e.g. narrative paragraphs. Unknown label types are assumed
+    reachable so extractOne still reports them.
+    """
+    if threshold <= WRATIO_LONG_MAX_SCORE:
+        return True
+    for label in labels:
+        if not isinstance(label, str):
+            return True
+        label_length = _label_length(label)
+        if not text_length or not label_length:
+            # Empty processed strings always score 0
+            continue
+        if max(text_length, label_length) <= WRATIO_LONG_RATIO * min(text_length, label_length):
+            return True
+    return False
+
 
 class FieldMatcher:
     """
@@ -52,6 +94,7 @@ class FieldMatcher:
                 
             best_field, best_score = None, 0
             field_patterns = self.field_mapper.get_field_patterns()
+            text_length = _query_length(text_lower)
             
             # Use pre-computed field patterns for faster matching
             for field, pattern in field_patterns.items():
@@ -59,12 +102,18 @@ class FieldMatcher:
                     labels = pattern.get('labels', [])
                     if not labels:
                         continue
+                    
+                    threshold = pattern.get('threshold', 70)
+                    if not _can_reach(text_length, labels, threshold):
+                        continue
                         
                     match, match_score = process.extractOne(text_lower, labels)
-                    threshold = pattern.get('threshold', 70)
                     
                     if match_score >= threshold and match_score > best_score:
                         best_field, best_score = field, match_score
+                        if best_score >= EXACT_SCORE:
+                            # Later fields would need a strictly higher score
+                            break
                 except Exception as e:
                     logger.warning(f"Error matching field '{field}': {str(e)}")
                     raise ProcessingError(f"Failed to match field '{field}': {str(e)}") from e
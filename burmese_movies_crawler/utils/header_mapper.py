@@ -2,6 +2,7 @@
 Header mapping utilities for table extraction.
 """
 import logging
+from collections import OrderedDict
 from typing import Dict, List, Tuple, Optional
 
 from burmese_movies_crawler.utils.exceptions import TableProcessingError
@@ -9,6 +10,9 @@ from burmese_movies_crawler.utils.field_matcher import FieldMatcher
 
 logger = logging.getLogger(__name__)
 
+# Header tuples and single headers seen across a crawl; least recently used evicted first
+HEADER_MAP_CACHE_SIZE = 256
+
 
 class HeaderMapper:
     """
@@ -23,7 +27,7 @@ class HeaderMapper:
             field_matcher: The field matcher to use for matching headers to fields
         """
         self.field_matcher = field_matcher
-        self._header_map_cache: Dict[Tuple[str, ...], Dict[str, str]] = {}
+        self._header_map_cache: "OrderedDict[Tuple[str, ...], Dict[str, str]]" = OrderedDict()
     
     def map(self, headers: List[str]) -> Dict[str, str]:
         """
@@ -53,6 +57,7 @@ class HeaderMapper:
                 # Check if we already processed these headers
                 try:
                     if headers_key in self._header_map_cache:
+                        self._header_map_cache.move_to_end(headers_key)
                         return dict(self._header_map_cache[headers_key])
                 except Exception as e:
                     logger.warning(f"Error checking headers cache: {str(e)}")
@@ -74,6 +79,7 @@ class HeaderMapper:
                             if header_key in self._header_map_cache:
                                 cached_result = self._header_map_cache[header_key]
                                 if head in cached_result:
+                                    self._header_map_cache.move_to_end(header_key)
                                     results[head] = cached_result[head]
                                     continue
                         except Exception:
@@ -88,7 +94,7 @@ class HeaderMapper:
                         if use_cache:
                             try:
                                 header_key = tuple([head])
-                                self._header_map_cache[header_key] = {head: field}
+                                self._cache_put(header_key, {head: field})
                             except Exception:
                                 # Ignore cache errors
                                 pass
@@ -100,7 +106,7 @@ class HeaderMapper:
             # Cache the mapping for these headers if caching is enabled
             if use_cache and headers_key:
                 try:
-                    self._header_map_cache[headers_key] = dict(results)
+                    self._cache_put(headers_key, dict(results))
                 except Exception as e:
                     logger.warning(f"Error caching header mapping: {str(e)}")
                 
@@ -111,4 +117,10 @@ class HeaderMapper:
             raise
         except Exception as e:
             logger.error(f"Header mapping error: {str(e)}")
-            raise TableProcessingError(f"Failed to map headers: {str(e)}") from e
\ No newline at end of file
+            raise TableProcessingError(f"Failed to map headers: {str(e)}") from e
+
+    def _cache_put(self, key: Tuple[str, ...], mapping: Dict[str, str]) -> None:
+        """Store a mapping, evicting the least recently used entry once the cache is full."""
+        self._header_map_cache[key] = mapping
+        if len(self._header_map_cache) > HEADER_MAP_CACHE_SIZE:
+            self._header_map_cache.popitem(last=False)
@@ -0,0 +1,40 @@
+"""
+JSON file helpers for crawl outputs.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional: C-accelerated encoder, stdlib json is the fallback
+    orjson = None
+
+
+def save_json(data: Any, file_path: str, indent: int = 2) -> None:
+    """
+    Write data to a UTF-8 JSON file.
+
+    Uses orjson when it is installed and the indent is 2 or compact (the only
+    layouts orjson supports); any other indent goes through the standard
+    library. Either way the document is encoded in memory and written with a
+    single call, and values stdlib json cannot encode (e.g. datetime) raise
+    TypeError.
+
+    Args:
+        data: JSON-serializable data
+        file_path: Destination path
+        indent: Indentation width; 0 or None writes compact JSON
+    """
+    if orjson is not None and indent in (None, 0, 2):
+        # Passthrough options make orjson reject the types stdlib json rejects
+        option = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                  | orjson.OPT_PASSTHROUGH_DATACLASS)
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        data_bytes = orjson.dumps(data, option=option)
+    else:
+        # Encode up front: json.dump() would issue one write() per encoded chunk
+        data_bytes = json.dumps(data, indent=indent or None, ensure_ascii=False).encode("utf-8")
+
+    with open(file_path, "wb") as f:
+        f.write(data_bytes)
@@ -1,15 +1,67 @@
 # # burmese_movies_crawler/utils/link_utils.py
 
-from urllib.parse import urlparse
 import logging
+import re
+from urllib.parse import urlparse
 from scrapy.http import HtmlResponse
+from lxml import etree
+import functools
 import hashlib
 from burmese_movies_crawler.settings import MOCK_MODE
 logger = logging.getLogger(__name__)
 import scrapy
 import os
 
-from urllib.parse import urlparse
+# Scheme, netloc and path as urllib.parse.urlparse splits them, in one match
+_URL_RE = re.compile(r'^(?:([a-z][a-z0-9+.\-]*):)?(?://([^/?#]*))?([^?#]*)', re.I | re.A)
+
+_PLACEHOLDER_URLS = frozenset(("", "none", "void(0)"))
+_UNSAFE_URL_CHARS = str.maketrans('', '', '\t\r\n')
+_C0_CONTROL_OR_SPACE = ''.join(chr(i) for i in range(0x21))
+
+def _split_url(url):
+    """Return (scheme, netloc, path) for `url` with urlparse's semantics."""
+    url = url.lstrip(_C0_CONTROL_OR_SPACE).translate(_UNSAFE_URL_CHARS)
+    scheme, netloc, path = _URL_RE.match(url).groups()
+    netloc = netloc or ''
+    if '[' in netloc or ']' in netloc:
+        # Bracketed (IPv6) hosts are rare; let urllib validate them exactly
+        parsed = urlparse(url)
+        return parsed.scheme, parsed.netloc, parsed.path
+    scheme = scheme.lower() if scheme else ''
+    if ';' in path and scheme in ('http', 'https'):
+        # urlparse splits ;params off the last path segment
+        i = path.find(';', path.rfind('/')) if '/' in path else path.find(';')
+        path = path[:i]
+    return scheme, netloc, path
+
+@functools.lru_cache(maxsize=65536)
+def _link_rejection(url):
+    """Return why a stripped URL is rejected, or None if it is valid. Memoized per URL."""
+    url_lower = url.lower()
+    scheme, netloc, path = _split_url(url)
+
+    # Reject obvious garbage or placeholders
+    if url_lower in _PLACEHOLDER_URLS or url_lower.endswith("/none"):
+        return "Empty or None"
+
+    # Reject fragment-only links or base URLs without paths
+    if url_lower.startswith('#') or (scheme in ('http', 'https') and netloc and (not path or path == '/')):
+        return "Fragment-only link or base URL"
+
+    # Reject known non-crawlable schemes
+    if url_lower.startswith(('javascript:', 'mailto:', 'tel:')):
+        return "Non-crawlable scheme"
+
+    # Allow valid absolute http/https URLs
+    if scheme in ("http", "https") and netloc:
+        return None
+
+    # Accept clean relative URLs (must look like real paths)
+    if not scheme and path and path.startswith(("/", "./", "../")):
+        return None
+
+    return "Unsupported or malformed URL format"
 
 def is_valid_link(url, invalid_links_log=None):
     """
@@ -22,55 +74,36 @@ def is_valid_link(url, invalid_links_log=None):
     Returns:
     - bool: True if the URL is valid for crawling.
     """
-    def log(reason):
-        if invalid_links_log is not None:
-            invalid_links_log.append((reason, url))
-
     if not isinstance(url, str):
-        log("Non-string input")
-        return False
-
-    url = url.strip()
-    url_lower = url.lower()
-
-    # Parse URL first so we can use it for validation
-    parsed = urlparse(url)
-    
-    # Reject obvious garbage or placeholders
-    if url_lower in ("", "none", "void(0)") or url_lower.endswith("/none"):
-        log("Empty or None")
-        return False
-    
-    # Reject fragment-only links or base URLs without paths
-    if url_lower.startswith('#') or (parsed.scheme in ('http', 'https') and parsed.netloc and (not parsed.path or parsed.path == '/')):
-        log("Fragment-only link or base URL")
-        return False
-
-    # Reject known non-crawlable schemes
-    if url_lower.startswith(('javascript:', 'mailto:', 'tel:')):
-        log("Non-crawlable scheme")
-        return False
+        reason = "Non-string input"
+    else:
+        url = url.strip()
+        reason = _link_rejection(url)
 
-    # Allow valid absolute http/https URLs
-    if parsed.scheme in ("http", "https") and parsed.netloc:
+    if reason is None:
         return True
+    if invalid_links_log is not None:
+        invalid_links_log.append((reason, url))
+    return False
 
-    # Accept clean relative URLs (must look like real paths)
-    if not parsed.scheme and parsed.path and parsed.path.startswith(("/", "./", "../")):
-        return True
+# Precompiled count() queries: libxml2 counts the nodes itself, so no selector
+# list is built just to take its length
+PAGE_STAT_XPATHS = {
+    'links': etree.XPath('count(//a)'),
+    'images': etree.XPath('count(//img)'),
+    'iframes': etree.XPath('count(//iframe)'),
+    'paragraphs': etree.XPath('count(//p)'),
+    'tables': etree.XPath('count(//table)'),
+}
 
-    log("Unsupported or malformed URL format")
-    return False
+# Rows are only compared against a threshold, so stop counting once it is reached
+TABLE_BODY_ROWS_XPATH = etree.XPath('count((//table//tbody//tr)[position() <= $limit])')
+TABLE_ROWS_XPATH = etree.XPath('count((//table//tr)[position() <= $limit])')
 
 def extract_page_stats(response):
     """Count basic elements on the page for classification."""
-    return {
-        'links': len(response.xpath('//a')),
-        'images': len(response.xpath('//img')),
-        'iframes': len(response.xpath('//iframe')),
-        'paragraphs': len(response.xpath('//p')),
-        'tables': len(response.xpath('//table')),
-    }
+    root = response.selector.root
+    return {name: int(count(root)) for name, count in PAGE_STAT_XPATHS.items()}
 
 def rule_detail_like(stats):
     """Negative rule: pages with iframes but very few links look like detail pages."""
@@ -86,30 +119,76 @@ def rule_text_heavy(stats, thresholds):
 
 def rule_table_catalogue(response, stats, thresholds):
     if stats['tables'] >= 1:
-        rows = response.css('table tbody tr') or response.css('table tr')
-        return len(rows) >= thresholds['table_min_rows']
+        root = response.selector.root
+        limit = thresholds['table_min_rows']
+        rows = TABLE_BODY_ROWS_XPATH(root, limit=limit) or TABLE_ROWS_XPATH(root, limit=limit)
+        return rows >= limit
     return False
 
 def rule_fallback_links(stats, thresholds):
     return stats['links'] > thresholds['fallback_min_links'] and \
            stats['images'] <= thresholds['fallback_max_images']
 
-def evaluate_catalogue_rules(response, stats, rules, thresholds):
+def compile_catalogue_rules(rules):
     """
-    Run each rule function and collect (name, passed, weight).
-    `rules` is a list of (name, fn, weight) where fn takes either
-    (stats, thresholds) or (response, stats, thresholds) for table rules.
+    Resolve each rule's calling convention once.
+    `rules` is a list of (name, fn, weight); returns a tuple of
+    (name, fn, needs_response, weight), where table rules take the response.
+    """
+    return tuple((name, rule_fn, name == "table_catalogue", weight) for name, rule_fn, weight in rules)
+
+def evaluate_compiled_rules(response, stats, compiled_rules, thresholds):
+    """
+    Run each rule from compile_catalogue_rules and collect (name, passed, weight).
     """
     results = []
-    for name, rule_fn, weight in rules:
+    for name, rule_fn, needs_response, weight in compiled_rules:
         try:
-            passed = rule_fn(response, stats, thresholds) if name == "table_catalogue" else rule_fn(stats, thresholds)
+            passed = rule_fn(response, stats, thresholds) if needs_response else rule_fn(stats, thresholds)
             results.append({'name': name, 'passed': passed, 'weight': weight})
         except Exception as e:
             logger.error(f"[Rule Error] {name}: {e}")
             results.append({'name': name, 'passed': False, 'weight': weight})
     return results
 
+def order_rules_for_early_exit(compiled_rules):
+    """
+    Order compiled rules so catalogue_score_reaches can stop as early as possible:
+    stats-only rules before rules that query the response, heavier weights first.
+    """
+    return tuple(sorted(compiled_rules, key=lambda rule: (rule[2], -rule[3])))
+
+def catalogue_score_reaches(response, stats, compiled_rules, thresholds, score_threshold):
+    """
+    Return whether the "sum" catalogue score reaches `score_threshold`, stopping as
+    soon as the outcome is decided: once the running score reaches the threshold, or
+    once the remaining weights can no longer get it there. Assumes non-negative weights.
+    """
+    score = 0
+    remaining = sum(weight for _, _, _, weight in compiled_rules)
+    for name, rule_fn, needs_response, weight in compiled_rules:
+        if score >= score_threshold:
+            return True
+        if score + remaining < score_threshold:
+            return False
+        remaining -= weight
+        try:
+            passed = rule_fn(response, stats, thresholds) if needs_response else rule_fn(stats, thresholds)
+        except Exception as e:
+            logger.error(f"[Rule Error] {name}: {e}")
+            passed = False
+        if passed:
+            score += weight
+    return score >= score_threshold
+
+def evaluate_catalogue_rules(response, stats, rules, thresholds):
+    """
+    Run each rule function and collect (name, passed, weight).
+    `rules` is a list of (name, fn, weight) where fn takes either
+    (stats, thresholds) or (response, stats, thresholds) for table rules.
+    """
+    return evaluate_compiled_rules(response, stats, compile_catalogue_rules(rules), thresholds)
+
 def compute_catalogue_score(rule_results, method="sum"):
     """
     Combine rule_results into a single score or boolean.
@@ -118,24 +197,51 @@ def compute_catalogue_score(rule_results, method="sum"):
     if method == "sum":
         return sum(r['weight'] for r in rule_results if r['passed'])
     elif method == "weighted_average":
-        total = sum(r['weight'] for r in rule_results)
-        passed = sum(r['weight'] for r in rule_results if r['passed'])
+        # Single pass over the results for both sums
+        total = passed = 0
+        for r in rule_results:
+            weight = r['weight']
+            total += weight
+            if r['passed']:
+                passed += weight
         return (passed / total) * 100 if total else 0
     elif method == "strict_majority":
         return sum(r['passed'] for r in rule_results) > len(rule_results) / 2
     return sum(r['weight'] for r in rule_results if r['passed'])
 
+def _read_fixture(fixture_path):
+    """
+    Return a fixture's raw HTML bytes.
+    Bytes go straight into HtmlResponse, avoiding a UTF-8 decode and re-encode per load.
+    """
+    with open(fixture_path, "rb") as f:
+        return f.read()
+
+@functools.lru_cache(maxsize=4096)
+def url_to_fixture_name(url: str) -> str:
+    """Safe hash-based fixture naming (BLAKE2b); memoized since catalogue and pagination URLs recur."""
+    return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+@functools.lru_cache(maxsize=4096)
+def legacy_fixture_name(url: str) -> str:
+    """MD5-based name used by fixtures recorded before the switch to BLAKE2b."""
+    return hashlib.md5(url.encode()).hexdigest()
+
 def get_response_or_request(url: str, callback):
     if MOCK_MODE:
-        # Safe hash-based naming (MD5)
-        hashname = hashlib.md5(url.encode()).hexdigest()
+        hashname = url_to_fixture_name(url)
         fixture_path = os.path.join("tests", "fixtures", f"{hashname}.html")
 
-        if not os.path.exists(fixture_path):
-            raise FileNotFoundError(f"[MOCK_MODE] Fixture not found for {url} ({fixture_path})")
-
-        with open(fixture_path, encoding="utf-8") as f:
-            html = f.read()
+        try:
+            html = _read_fixture(fixture_path)
+        except FileNotFoundError:
+            # Fall back to fixtures already on disk under their MD5 name
+            hashname = legacy_fixture_name(url)
+            legacy_path = os.path.join("tests", "fixtures", f"{hashname}.html")
+            try:
+                html = _read_fixture(legacy_path)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"[MOCK_MODE] Fixture not found for {url} ({fixture_path})") from None
 
         return HtmlResponse(url=f"mock://{hashname}", body=html, encoding="utf-8")
     else:
@@ -1,32 +1,49 @@
 # # burmese_movies_crawler/utils/orchestrator.py
 
-from scrapy.http import HtmlResponse
+from lxml import etree
+from parsel import Selector
+from parsel.csstranslator import css2xpath
+from scrapy.http import HtmlResponse, TextResponse
 from burmese_movies_crawler.utils.page_classifier import PageClassifier
 from burmese_movies_crawler.extractors.engine import ExtractorEngine
 from burmese_movies_crawler.utils.candidate_extractor import extract_candidate_blocks
 from burmese_movies_crawler.utils.trafilatura_selectorr import pick_movie_block_with_trafilatura
+from burmese_movies_crawler.utils.selector_utils import get_root
 import logging
+from typing import Union
 
 logger = logging.getLogger(__name__)
-def handle_page(html: str, url: str,
+
+# WordPress-style pagination link, translated and compiled once
+NEXT_PAGE_XPATH = etree.XPath(css2xpath('a.next.page-numbers::attr(href)'), smart_strings=False)
+
+def handle_page(html: Union[str, TextResponse], url: str,
                 classifier: PageClassifier,
                 extractor: ExtractorEngine,
                 content_type: str = "movies") -> dict:
 
-    response = HtmlResponse(url=url, body=html, encoding='utf-8')
+    # Callers holding a Scrapy response pass it through so the page is parsed
+    # once and response.meta caches (e.g. page stats) stay attached to it
+    if isinstance(html, TextResponse):
+        response = html
+    else:
+        response = HtmlResponse(url=url, body=html, encoding='utf-8')
+
+    kind = classifier.classify(response)
 
-    if classifier.is_catalogue_page(response): 
+    if kind == "catalogue":
         links = extractor.extract_links(response)
-        next_page = response.css('a.next.page-numbers::attr(href)').get()
+        next_links = NEXT_PAGE_XPATH(get_root(response))
+        next_page = next_links[0] if next_links else None
         return {"type": "catalogue", "links": links, "next_page": next_page}
 
-    if classifier.is_detail_page(response):
+    if kind == "detail":
         data = extractor.extract_main_fields(response)
         data.update(extractor.extract_paragraphs(response))
         return {"type": "detail", "item": data}
 
-    # fallback via LLM
-    candidates = extract_candidate_blocks(html)
+    # fallback via LLM, reusing the tree Scrapy already parsed for classification
+    candidates = extract_candidate_blocks(response.selector.root)
     if not candidates:
         return {"type": "unknown", "fallback_links": []}
 
@@ -37,8 +54,9 @@ def handle_page(html: str, url: str,
         logger.warning(f"[LLM fallback failed] for {url}: {e}")
         return {"type": "unknown", "fallback_links": [], "llm_error": str(e)}
 
-    # generate one-off fake detail page
-    fake_resp = HtmlResponse(url=url, body=block_html, encoding='utf-8')
+    # the extractors only need css()/xpath(), so a bare Selector over the chosen
+    # block stands in for a detail page without building a full HtmlResponse
+    fake_resp = Selector(text=block_html)
     try:
         data = extractor.extract_main_fields(fake_resp)
         data.update(extractor.extract_paragraphs(fake_resp))
@@ -1,28 +1,77 @@
 # # burmese_movies_crawler/utils/page_classifier.py
 
+import weakref
+
 from scrapy.http import HtmlResponse
 from .link_utils import *
 from burmese_movies_crawler.utils.link_utils import (
     extract_page_stats, rule_detail_like,
     rule_link_heavy, rule_text_heavy, rule_table_catalogue, rule_fallback_links,
-    evaluate_catalogue_rules, compute_catalogue_score
+    compute_catalogue_score,
+    compile_catalogue_rules, evaluate_compiled_rules,
+    order_rules_for_early_exit, catalogue_score_reaches
 )
 
 class PageClassifier:
     def __init__(self, thresholds, rules):
         self.thresholds = thresholds
         self.rules = rules
+        # Calling conventions are resolved once instead of on every page
+        self._compiled_rules = compile_catalogue_rules(rules)
+        # Cheap rules first so the table rule's extra tree query is often skipped;
+        # stopping early is only sound when no rule can lower the score
+        self._early_exit = all(weight >= 0 for _, _, _, weight in self._compiled_rules)
+        if self._early_exit:
+            self._compiled_rules = order_rules_for_early_exit(self._compiled_rules)
+        # Page stats and kind per response object; dropped with the response, and never
+        # copied to child requests or replaced responses the way request meta is
+        self._stats = weakref.WeakKeyDictionary()
+        self._kinds = weakref.WeakKeyDictionary()
+
+    def _page_stats(self, response):
+        stats = self._stats.get(response)
+        if stats is None:
+            stats = self._stats[response] = extract_page_stats(response)
+        return stats
+
+    def _is_catalogue(self, response, stats):
+        if self._early_exit:
+            return catalogue_score_reaches(response, stats, self._compiled_rules,
+                                           self.thresholds, self.thresholds['score_threshold'])
+        rule_results = evaluate_compiled_rules(response, stats, self._compiled_rules, self.thresholds)
+        score = compute_catalogue_score(rule_results, method="sum")
+        return score >= self.thresholds['score_threshold']
 
     def is_catalogue_page(self, response):
-        stats = extract_page_stats(response)
+        stats = self._page_stats(response)
         if not rule_detail_like(stats):
-            rule_results = evaluate_catalogue_rules(response, stats, self.rules, self.thresholds)
-            score = compute_catalogue_score(rule_results, method="sum")
-            return score >= self.thresholds['score_threshold']
+            return self._is_catalogue(response, stats)
         return False
 
-        return score >= threshold
+    def classify(self, response):
+        """
+        Classify a page as "catalogue", "detail" or "other" from a single stats pass.
+
+        Equivalent to calling is_catalogue_page and then is_detail_page, but the
+        page is only counted once. The decision is remembered per response
+        object, so later passes over the same response reuse it instead of
+        re-running the rules.
+        """
+        kind = self._kinds.get(response)
+        if kind is not None:
+            return kind
+
+        stats = self._page_stats(response)
+        if rule_detail_like(stats):
+            kind = "detail"
+        elif self._is_catalogue(response, stats):
+            kind = "catalogue"
+        else:
+            kind = "other"
+
+        self._kinds[response] = kind
+        return kind
 
     def is_detail_page(self, response):
-        stats = extract_page_stats(response)
+        stats = self._page_stats(response)
         return rule_detail_like(stats)
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""
+Helpers for evaluating precompiled XPath expressions against responses.
+"""
+from lxml import etree
+
+
+def get_root(response) -> etree._Element:
+    """
+    Return the parsed lxml tree behind a Scrapy response or a parsel Selector.
+
+    Precompiled `etree.XPath` objects are evaluated directly on this root, which
+    skips parsel's per-call CSS translation and XPath compilation.
+
+    Args:
+        response: Scrapy response or parsel Selector
+
+    Returns:
+        The lxml root element
+    """
+    selector = getattr(response, 'selector', response)
+    return selector.root
+
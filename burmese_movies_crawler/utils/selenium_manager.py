@@ -1,21 +1,213 @@
 # # burmese_movies_crawler/utils/selenium_manager.py
 
+import logging
+import queue
+import threading
+
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from twisted.internet.threads import deferToThread
+from urllib3.exceptions import MaxRetryError
+
+logger = logging.getLogger(__name__)
+
+# Movie cards on catalogue pages; pass as `wait_selector` when rendering a catalogue.
+# Detail pages have no such element, so by default render() only waits for the
+# document to finish loading.
+CATALOGUE_WAIT_SELECTOR = "div.movie, div.item"
+DEFAULT_WAIT_SELECTOR = None
+DEFAULT_WAIT_TIMEOUT = 10
+DEFAULT_POOL_SIZE = 4
+
+# Subresources the crawler never reads, blocked at the network layer through CDP
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.css",
+]
+
+def _document_complete(driver):
+    return driver.execute_script("return document.readyState") == "complete"
+
+
+# Put in the pool by close() so threads blocked waiting for a driver wake up
+_CLOSED = object()
+
 
 class SeleniumManager:
-    def __init__(self):
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE):
         self.opts = Options()
         self.opts.add_argument("--headless")
         self.opts.add_argument("--disable-gpu")
         self.opts.add_argument("--no-sandbox")
         self.opts.add_argument("--disable-dev-shm-usage")
-        self.driver = None
+        # Only the DOM is scraped; poster URLs come from src attributes
+        self.opts.add_argument("--blink-settings=imagesEnabled=false")
+
+        # Up to `pool_size` drivers are started on demand and shared by render()
+        self.pool_size = pool_size
+        self._pool = queue.Queue()
+        self._drivers = []
+        # Pool slots reserved by threads whose driver is still starting
+        self._starting = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        # Driver lent to each thread by `with manager:`
+        self._local = threading.local()
+
+    def _start_driver(self):
+        driver = webdriver.Chrome(options=self.opts)
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning(f"Failed to block subresources via CDP: {e}")
+        return driver
+
+    @property
+    def driver(self):
+        """The driver lent to the current thread by `with manager:`, or None."""
+        return getattr(self._local, 'driver', None)
 
     def __enter__(self):
-        self.driver = webdriver.Chrome(options=self.opts)
-        return self.driver
+        # Borrow a pooled driver; it goes back to the pool, still running, on exit.
+        # Nested blocks on the same thread share it.
+        if self.driver is None:
+            self._local.driver = self._checkout()
+            self._local.depth = 0
+        self._local.depth += 1
+        return self._local.driver
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.driver:
-            self.driver.quit()
+        self._local.depth -= 1
+        if self._local.depth == 0:
+            driver, self._local.driver = self._local.driver, None
+            self._checkin(driver)
+
+    def close(self):
+        """Quit every started driver. Called once at shutdown; the manager can't be used afterwards."""
+        with self._lock:
+            self._closed = True
+            for driver in self._drivers:
+                try:
+                    driver.quit()
+                except Exception as e:
+                    logger.warning(f"Failed to quit Chrome Driver: {e}")
+            self._drivers.clear()
+            while True:
+                try:
+                    self._pool.get_nowait()
+                except queue.Empty:
+                    break
+        # Wakes threads waiting for a driver; each passes it on before raising
+        self._pool.put(_CLOSED)
+
+    def _checkout(self):
+        try:
+            driver = self._pool.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("SeleniumManager is closed")
+                reserved = len(self._drivers) + self._starting < self.pool_size
+                if reserved:
+                    self._starting += 1
+            if reserved:
+                return self._start_reserved_driver()
+            # Pool is full: wait for a driver to be returned
+            driver = self._pool.get()
+        if driver is _CLOSED:
+            self._pool.put(_CLOSED)
+            raise RuntimeError("SeleniumManager is closed")
+        return driver
+
+    def _start_reserved_driver(self):
+        # Chrome takes seconds to launch, so it starts outside the lock and
+        # other threads can check drivers in and out meanwhile
+        driver = None
+        try:
+            driver = self._start_driver()
+        finally:
+            with self._lock:
+                self._starting -= 1
+                closed = self._closed
+                if driver is not None and not closed:
+                    self._drivers.append(driver)
+                    logger.info(f"Chrome Driver started ({len(self._drivers)} running).")
+        if closed:
+            # close() ran while this driver was starting
+            driver.quit()
+            raise RuntimeError("SeleniumManager is closed")
+        return driver
+
+    def _checkin(self, driver):
+        with self._lock:
+            if self._closed:
+                # close() has already quit it
+                return
+        self._pool.put(driver)
+
+    def _discard(self, driver):
+        """Drop a driver whose browser session is gone, freeing its pool slot."""
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Failed to quit dead Chrome Driver: {e}")
+
+    def render(self, url, wait_selector=DEFAULT_WAIT_SELECTOR, timeout=DEFAULT_WAIT_TIMEOUT):
+        """
+        Load `url` in a pooled Chrome driver and return the rendered page source.
+
+        Drivers are started on first use, so crawls that never need JS
+        rendering never pay Chrome's startup cost. Instead of a fixed sleep,
+        this waits until `wait_selector` is present, or with no selector until
+        document.readyState is 'complete' (or `timeout` expires).
+        A driver whose browser has died is replaced and the page retried once.
+        Inside `with manager:` the driver lent to this thread is used.
+        """
+        if self.driver is not None:
+            return self._load(self.driver, url, wait_selector, timeout)
+
+        driver = self._checkout()
+        try:
+            return self._load(driver, url, wait_selector, timeout)
+        except TimeoutException:
+            # A slow page, not a dead browser
+            raise
+        except (WebDriverException, MaxRetryError) as e:
+            # Invalid session, "chrome not reachable", or the driver's HTTP server is gone
+            logger.warning(f"Chrome driver failed while rendering {url}, restarting it: {e}")
+            self._discard(driver)
+            driver = None
+        finally:
+            if driver is not None:
+                self._checkin(driver)
+
+        driver = self._checkout()
+        try:
+            return self._load(driver, url, wait_selector, timeout)
+        finally:
+            self._checkin(driver)
+
+    @staticmethod
+    def _load(driver, url, wait_selector, timeout):
+        driver.get(url)
+        if wait_selector:
+            condition = EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector))
+        else:
+            condition = _document_complete
+        try:
+            WebDriverWait(driver, timeout).until(condition)
+        except TimeoutException:
+            logger.warning(f"Timed out after {timeout}s waiting for '{wait_selector or 'page load'}' on {url}")
+        return driver.page_source
+
+    def render_deferred(self, url, **kwargs):
+        """Run render() in Twisted's thread pool so the reactor stays free; returns a Deferred."""
+        return deferToThread(self.render, url, **kwargs)
@@ -137,6 +137,9 @@ def main():
            'tests' in Path(root).parts or 'docs' in Path(root).parts:
             continue
         
+        # Prune them in place so os.walk never scans their subtrees (e.g. .git)
+        dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ('tests', 'docs')]
+        
         for file in files:
             if file.endswith('.py'):
                 runtime_files.append(os.path.join(root, file))
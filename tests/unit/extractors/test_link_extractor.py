@@ -2,11 +2,12 @@
 Tests for the LinkExtractor class.
 """
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 from scrapy.http import HtmlResponse, Request
 
 from burmese_movies_crawler.extractors.link_extractor import LinkExtractor
 from burmese_movies_crawler.utils.exceptions import ExtractionError
+from burmese_movies_crawler.utils.link_utils import is_valid_link
 
 
 def fake_response(url, body, status=200, meta=None):
@@ -103,7 +104,7 @@ def test_extract_links_with_css_error():
     """Test that extract correctly handles CSS selector errors."""
     # Create a mock response that raises an exception when css() is called
     response = MagicMock()
-    response.css.side_effect = Exception("CSS selector error")
+    type(response).selector = PropertyMock(side_effect=Exception("CSS selector error"))
     
     extractor = LinkExtractor()
     
@@ -116,8 +117,8 @@ def test_extract_links_with_link_processing_error():
     html = """
         <html>
             <body>
-                <a href="https://example.com/1">Link 1</a>
-                <a href="https://example.com/2">Link 2</a>
+                <a href="/1">Link 1</a>
+                <a href="/2">Link 2</a>
             </body>
         </html>
     """
@@ -135,4 +136,53 @@ def test_extract_links_with_link_processing_error():
         # Should continue processing and return the first link
         links = extractor.extract(response)
         assert len(links) == 1
-        assert links[0] == "https://example.com/1"
\ No newline at end of file
+        assert links[0] == "https://example.com/1"
+
+def test_extract_links_fast_paths_match_urljoin():
+    """Absolute and fragment-only links normalize exactly as urljoin + urldefrag would."""
+    from urllib.parse import urldefrag, urljoin
+
+    page_url = "https://example.com/movies/page?sort=new"
+    hrefs = [
+        "https://example.com/a", "http://other.org/b/../c", "https://example.com/d?x=1#y",
+        "HTTPS://example.com/e", "https://[::1]/f", "#", "#top", "/g#h", "mailto:a@b.c",
+    ]
+    html = "<html><body>" + "".join(f'<a href="{h}">x</a>' for h in hrefs) + "</body></html>"
+
+    invalid_links = []
+    links = LinkExtractor(invalid_links=invalid_links).extract(fake_response(page_url, html))
+
+    expected_invalid = []
+    expected = []
+    for href in hrefs:
+        clean = urldefrag(urljoin(page_url, href))[0]
+        if clean in expected:
+            continue
+        if is_valid_link(clean, expected_invalid):
+            expected.append(clean)
+
+    assert links == expected
+    assert invalid_links == expected_invalid
+
+
+def test_iter_links_stops_at_caller_cap():
+    """Links past the caller's cap are never normalized or validated."""
+    from itertools import islice
+
+    html = """
+        <html>
+            <body>
+                <a href="/first">First</a>
+                <a href="/first#again">Duplicate</a>
+                <a href="/second">Second</a>
+                <a href="mailto:late@example.com">Invalid, after the cap</a>
+            </body>
+        </html>
+    """
+    invalid_links = []
+    extractor = LinkExtractor(invalid_links=invalid_links)
+
+    links = list(islice(extractor.iter_links(fake_response("https://example.com", html)), 2))
+
+    assert links == ["https://example.com/first", "https://example.com/second"]
+    assert invalid_links == []
@@ -2,7 +2,7 @@
 Tests for the MainFieldExtractor class.
 """
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 from scrapy.http import HtmlResponse, Request
 
 from burmese_movies_crawler.extractors.main_field_extractor import MainFieldExtractor
@@ -143,9 +143,9 @@ def test_extract_main_fields_with_none_response(extractor):
 
 def test_extract_main_fields_with_css_error(extractor):
     """Test that extract correctly handles CSS selector errors."""
-    # Create a mock response that raises an exception when css() is called
+    # Create a mock response that raises an exception when the compiled selectors are evaluated
     response = MagicMock()
-    response.css.side_effect = Exception("CSS selector error")
+    type(response).selector = PropertyMock(side_effect=Exception("CSS selector error"))
     
     # Should handle errors for individual fields but not fail completely
     fields = extractor.extract(response)
@@ -170,8 +170,26 @@ def test_extract_field_value_with_combined_selector(extractor):
     assert value == "Test Movie"
 
 
+def test_extract_main_fields_prefers_earlier_selectors(extractor):
+    """Test that selector priority wins over document order."""
+    html = """
+        <html>
+            <div class="movie-title">Other Film</div>
+            <span class="year">1999</span>
+            <h1 class="entry-title">Real Title</h1>
+            <span class="ytps">2005</span>
+        </html>
+    """
+    response = fake_response("https://example.com", html)
+    extractor.text_cleaner.clean.side_effect = lambda text: text
+
+    fields = extractor.extract(response)
+
+    assert fields == {"title": "Real Title", "year": "2005"}
+
+
 def test_extract_field_value_with_individual_selectors(extractor):
-    """Test that extract_field_value correctly falls back to individual selectors."""
+    """Test that extract_field_value falls back to the string() query when the selectors fail."""
     html = """
         <html>
             <h1 class="title">Alt Title</h1>
@@ -179,22 +197,17 @@ def test_extract_field_value_with_individual_selectors(extractor):
     """
     response = fake_response("https://example.com", html)
     
-    # Test with combined selector that fails, then individual selectors
-    with patch.object(response, 'css') as mock_css:
-        # First call (combined selector) raises exception
-        # Second call (individual selector) returns a match
-        mock_match = MagicMock()
-        mock_match.get.return_value = "Alt Title"
-        
-        mock_css.side_effect = [
-            Exception("Combined selector error"),
-            mock_match
-        ]
-        
-        selectors = ["h1.entry-title::text", "h1.title::text"]
+    # Primary selector fails, then the string() fallback matches
+    primary = MagicMock(side_effect=Exception("Combined selector error"))
+    primary.path = "//h1"
+    fallback = MagicMock(return_value="Alt Title")
+    
+    selectors = ["h1.entry-title::text", "h1.title::text"]
+    with patch("burmese_movies_crawler.extractors.main_field_extractor.compile_xpaths",
+               return_value=((primary,), (fallback,))):
         value = extractor.extract_field_value(response, selectors)
-        
-        assert value == "Alt Title"
+    
+    assert value == "Alt Title"
 
 
 def test_extract_field_value_with_xpath_fallback(extractor):
@@ -206,20 +219,25 @@ def test_extract_field_value_with_xpath_fallback(extractor):
     """
     response = fake_response("https://example.com", html)
     
-    # Mock the CSS selector to return a match with no direct text
-    mock_match = MagicMock()
-    mock_match.get.return_value = None
-    
-    # Mock the xpath to return the nested text
-    mock_xpath_result = MagicMock()
-    mock_xpath_result.get.return_value = "Nested Title"
-    mock_match.xpath.return_value = mock_xpath_result
+    # h1.title has no direct text node, so only the string() fallback finds the nested text
+    selectors = ["h1.title::text"]
+    value = extractor.extract_field_value(response, selectors)
     
-    with patch.object(response, 'css', return_value=mock_match):
-        selectors = ["h1.title::text"]
-        value = extractor.extract_field_value(response, selectors)
-        
-        assert value == "Nested Title"
+    assert value == "Nested Title"
+
+
+def test_extract_field_value_attr_selector_has_no_text_fallback(extractor):
+    """Test that a missing attribute is not replaced by the element's text."""
+    html = """
+        <html>
+            <a class="trailer">Watch trailer</a>
+        </html>
+    """
+    response = fake_response("https://example.com", html)
+
+    value = extractor.extract_field_value(response, ["a.trailer::attr(href)"])
+
+    assert value is None
 
 
 def test_extract_field_value_with_no_selectors(extractor):
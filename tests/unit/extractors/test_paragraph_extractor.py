@@ -2,7 +2,7 @@
 Tests for the ParagraphExtractor class.
 """
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 from scrapy.http import HtmlResponse, Request
 
 from burmese_movies_crawler.extractors.paragraph_extractor import ParagraphExtractor
@@ -85,7 +85,7 @@ def extractor(field_matcher, text_cleaner):
         # Empty tag
         (
             "<html><body><div class='entry-content'><p></p><p>Genre: Mystery</p></div></body></html>",
-            [(None, 0), ("genre", 85)],
+            [("genre", 85)],
             {"genre": "Mystery"},
         ),
 
@@ -145,7 +145,7 @@ def test_extract_paragraphs_with_css_error(extractor):
     """Test that extract correctly handles CSS selector errors."""
     # Create a mock response that raises an exception when css() is called
     response = MagicMock()
-    response.css.side_effect = Exception("CSS selector error")
+    type(response).selector = PropertyMock(side_effect=Exception("CSS selector error"))
     
     with pytest.raises(ExtractionError):
         extractor.extract(response)
@@ -167,20 +167,55 @@ def test_extract_paragraphs_with_field_matching_error(extractor):
 
 def test_extract_paragraphs_with_paragraph_processing_error(extractor):
     """Test that extract correctly handles paragraph processing errors."""
-    # Create a mock response with a mix of valid and invalid paragraphs
-    class PartialBadResponse:
-        def css(self, selector):
-            class BadResult:
-                def getall(self):
-                    return ["Normal text", None, object()]  # None and object() will cause errors
-            return BadResult()
+    response = fake_response("https://example.com", "<html></html>")
+    
+    # None and object() will cause errors for individual paragraphs
+    with patch.object(extractor, "_collect_paragraphs", return_value=["Normal text", None, object()]):
+        result = extractor.extract(response)
     
     # Should handle errors for individual paragraphs
-    result = extractor.extract(PartialBadResponse())
     assert isinstance(result, dict)
     assert len(result) == 0
 
 
+def test_extract_paragraphs_collects_each_paragraph_once(extractor):
+    """Test that nested markup is matched on the full text and repeated texts are matched once."""
+    html = "<html><body><div class='entry-content'><p>Director: <b>John Doe</b></p><p>Genre: Drama</p></div></body></html>"
+    response = fake_response("https://example.com", html)
+
+    def mock_match(text):
+        if text == "Director: John Doe":
+            return ("director", 90)
+        if text == "Genre: Drama":
+            return ("genre", 85)
+        return (None, 0)
+
+    extractor.field_matcher.match.side_effect = mock_match
+    extractor.text_cleaner.clean.side_effect = lambda text: text.split(":", 1)[1].strip()
+
+    result = extractor.extract(response)
+
+    assert result == {"director": "John Doe", "genre": "Drama"}
+    matched = [call.args[0] for call in extractor.field_matcher.match.call_args_list]
+    assert matched == ["Director:", "Genre: Drama", "Director: John Doe"]
+
+
+def test_extract_paragraphs_splits_lines_on_br(extractor):
+    """Test that each <br>-separated line in a paragraph is matched on its own."""
+    html = ("<html><body><div class='entry-content'>"
+            "<p>Director: U Thu Kha<br>Genre: Drama<br>Cast: Nay Toe, Wutt Hmone</p>"
+            "</div></body></html>")
+    response = fake_response("https://example.com", html)
+
+    labels = {"Director": "director", "Genre": "genre", "Cast": "cast"}
+    extractor.field_matcher.match.side_effect = lambda text: (labels[text.split(":", 1)[0]], 90)
+    extractor.text_cleaner.clean.side_effect = lambda text: text.split(":", 1)[1].strip()
+
+    result = extractor.extract(response)
+
+    assert result == {"director": "U Thu Kha", "genre": "Drama", "cast": "Nay Toe, Wutt Hmone"}
+
+
 def test_extract_paragraphs_with_length_filtering(extractor):
     """Test that extract correctly filters paragraphs by length."""
     html = """
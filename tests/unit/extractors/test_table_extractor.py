@@ -101,6 +101,18 @@ def extractor(header_mapper):
             [{"title": "မြန်မာဖလင်မ်", "year": "၂၀၁၉"}]
         ),
 
+        # Nested markup in cells: text nodes are stripped and joined with spaces
+        (
+            """
+            <table>
+                <thead><tr><th>Title</th><th>Year</th></tr></thead>
+                <tbody><tr><td> Nested <b>Film</b>&nbsp;</td><td><span>2024</span></td></tr></tbody>
+            </table>
+            """,
+            {"Title": "title", "Year": "year"},
+            [{"title": "Nested Film", "year": "2024"}]
+        ),
+
         # No <thead> tag
         (
             """
@@ -154,20 +166,12 @@ def test_extract_with_none_table(extractor):
 
 def test_extract_with_no_headers(extractor):
     """Test that extract correctly handles tables with no headers."""
-    # Create a mock table that returns empty headers
-    class EmptyHeadersTable:
-        def css(self, selector):
-            if "thead" in selector or "tr:first-child" in selector:
-                class EmptyResult:
-                    def getall(self):
-                        return []
-                return EmptyResult()
-            return []
-    
-    response = fake_response("https://example.com", "<table></table>")
+    # A table whose header cells hold no text
+    response = fake_response("https://example.com", "<table><tr><td></td></tr></table>")
+    table = response.css("table")[0]
     
     # Should return empty generator, not raise exception
-    items = list(extractor.extract(response, EmptyHeadersTable()))
+    items = list(extractor.extract(response, table))
     assert len(items) == 0
 
 
@@ -191,72 +195,44 @@ def test_extract_with_header_mapping_error(extractor):
 
 def test_extract_with_row_processing_error(extractor):
     """Test that extract correctly handles row processing errors."""
-    # Create a mock table with headers but that raises an exception when getting rows
-    class BadTable:
-        def css(self, selector):
-            if "thead" in selector:
-                class HeaderResult:
-                    def getall(self):
-                        return ["Header1", "Header2"]
-                return HeaderResult()
-            elif "tbody tr" in selector:
-                raise Exception("Row processing error")
-            return []
-    
-    response = fake_response("https://example.com", "<table></table>")
+    html = """
+        <table>
+            <thead><tr><th>Header1</th><th>Header2</th></tr></thead>
+            <tbody><tr><td>a</td><td>b</td></tr></tbody>
+        </table>
+    """
+    response = fake_response("https://example.com", html)
+    table = response.css("table")[0]
     
     # Configure the header_mapper mock to return a mapping
     extractor.header_mapper.map.return_value = {"Header1": "field1", "Header2": "field2"}
     
-    with pytest.raises(TableProcessingError):
-        list(extractor.extract(response, BadTable()))
+    # Getting the rows raises
+    with patch("burmese_movies_crawler.extractors.table_extractor.ROWS_XPATH",
+               side_effect=Exception("Row processing error")):
+        with pytest.raises(TableProcessingError):
+            list(extractor.extract(response, table))
 
 
 def test_extract_with_cell_processing_error(extractor):
     """Test that extract correctly handles cell processing errors."""
-    # Create a mock table with headers and rows but that raises an exception when getting cells
-    class BadRowsTable:
-        def css(self, selector):
-            if "thead" in selector:
-                class HeaderResult:
-                    def getall(self):
-                        return ["Title", "Year"]
-                return HeaderResult()
-            elif "tbody tr" in selector:
-                return [MagicMock()]  # Return a mock row
-            elif "tr:first-child" in selector:
-                # Return empty for the fallback header selector
-                class EmptyResult:
-                    def getall(self):
-                        return []
-                return EmptyResult()
-            return []
-    
-    # Create a mock row that raises an exception when getting cells
-    mock_row = MagicMock()
-    mock_row.css.side_effect = Exception("Cell processing error")
-    
-    response = fake_response("https://example.com", "<table></table>")
+    html = """
+        <table>
+            <thead><tr><th>Title</th><th>Year</th></tr></thead>
+            <tbody><tr><td>Test Film</td><td>2021</td></tr></tbody>
+        </table>
+    """
+    response = fake_response("https://example.com", html)
+    table = response.css("table")[0]
     
     # Configure the header_mapper mock to return a mapping
     extractor.header_mapper.map.return_value = {"Title": "title", "Year": "year"}
     
-    # Create a table instance without using lambda to avoid recursion
-    table = BadRowsTable()
-    original_css = table.css
-    
-    # Define a non-recursive function to replace css
-    def modified_css(selector):
-        if "tbody tr" in selector:
-            return [mock_row]
-        else:
-            return original_css(selector)
-    
-    # Replace the css method
-    table.css = modified_css
-    
-    # Should handle the error and return an empty list
-    items = list(extractor.extract(response, table))
+    # Getting the cells of a row raises
+    with patch("burmese_movies_crawler.extractors.table_extractor.CELLS_XPATH",
+               side_effect=Exception("Cell processing error")):
+        # Should handle the error and return an empty list
+        items = list(extractor.extract(response, table))
     assert len(items) == 0
 
 
@@ -273,4 +249,17 @@ def test_create_item():
     assert isinstance(item, BurmeseMoviesItem)
     assert item["title"] == "Test Film"
     assert item["year"] == "2021"
-    assert item["director"] == "Director Name"
\ No newline at end of file
+    assert item["director"] == "Director Name"
+
+def test_create_item_skips_unmapped_and_missing_cells():
+    """Unmapped columns, unknown fields and cells missing from short rows are skipped."""
+    extractor = TableExtractor(MagicMock())
+    
+    headers = ["Random", "Title", "Rating", "Year"]
+    header_map = {"Title": "title", "Rating": "not_a_field", "Year": "year"}
+    
+    active = extractor._active_columns(headers, header_map)
+    item = extractor._create_item(["XYZ", "Short Row Film"], headers, header_map, active)
+    
+    assert active == [(1, "title"), (3, "year")]
+    assert dict(item) == {"title": "Short Row Film"}
@@ -32,6 +32,12 @@ def test_director_trimmed(raw, expected):
     item = MovieItem(title="X", year=2000, director=raw)
     assert item.director == expected
 
+@pytest.mark.parametrize("field", ["title", "director"])
+def test_blank_required_text_rejected(field):
+    values = {"title": "X", "year": 2000, "director": "Dir", field: "  \t "}
+    with pytest.raises(ValidationError):
+        MovieItem(**values)
+
 @pytest.mark.parametrize("cast_input,expected", [
     ("Actor One, Actor Two , Actor Three  ", ["Actor One", "Actor Two", "Actor Three"]),
     ("A,,B,, ,C", ["A", "B", "C"]),
@@ -55,6 +61,13 @@ def test_invalid_poster_url_format(bad_url):
     with pytest.raises(ValidationError):
         MovieItem(title="Bad URL", year=2010, director="Dev", poster_url=bad_url)
 
+@pytest.mark.parametrize("placeholder", ["", "  ", "#"])
+def test_placeholder_urls_convert_to_none(placeholder):
+    item = MovieItem(title="No Links", year=2015, director="Dev",
+                     poster_url=placeholder, streaming_link=placeholder)
+    assert item.poster_url is None
+    assert item.streaming_link is None
+
 @pytest.mark.parametrize("long_text", ["A" * 1001, " " * 1500])
 def test_synopsis_exceeds_max_length(long_text):
     with pytest.raises(ValidationError):
@@ -73,3 +86,7 @@ def test_year_at_bounds(valid_year):
 def test_cast_list_cleaned(input_list, expected):
     item = MovieItem(title="Cast Clean", year=2022, director="Cleaner", cast=input_list)
     assert item.cast == expected
+
+def test_synopsis_at_max_length_is_stripped():
+    item = MovieItem(title="Long", year=2020, director="Editor", synopsis=" " + "A" * 998 + " ")
+    assert item.synopsis == "A" * 998
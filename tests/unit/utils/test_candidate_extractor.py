@@ -1,6 +1,10 @@
 import pytest
 import json
 from pathlib import Path
+from scrapy.http import HtmlResponse
+import lxml.html
+from lxml import etree
+from burmese_movies_crawler.utils import candidate_extractor
 from burmese_movies_crawler.utils.candidate_extractor import extract_candidate_blocks
 
 FIXTURE_ROOT = Path(__file__).parent.parent / "fixtures"
@@ -34,3 +38,35 @@ def test_malformed_html_still_extracts():
     candidates = extract_candidate_blocks(html)
     assert len(candidates) == 1
     assert "Great movie" in candidates[0]
+
+def test_script_and_style_text_is_ignored():
+    block = "<div><a href='/watch'><img src='poster.jpg'><p>A long enough movie description</p></a>{}</div>"
+    with_script = block.format("<script>if (!user) showLogin('login');</script><style>.cookie{}</style>")
+    assert len(extract_candidate_blocks(with_script)) == 1
+
+    # Script text alone doesn't make a block long enough to rank
+    short = "<div><a href='/w'><img src='p.jpg'>Short</a><script>" + "x" * 100 + "</script></div>"
+    assert extract_candidate_blocks(short) == []
+
+@pytest.mark.parametrize("html", ["<!-- nothing here -->", "<?xml version='1.0' encoding='utf-8'?>"])
+def test_documents_without_content_return_no_candidates(html):
+    assert extract_candidate_blocks(html) == []
+
+def test_xml_declared_page_is_parsed():
+    html = ("<?xml version='1.0' encoding='iso-8859-1'?><html><body><div><a href='/watch'>"
+            "<img src='poster.jpg'><p>ဇာတ်ကား with a long enough description</p></a></div></body></html>")
+    candidates = extract_candidate_blocks(html)
+    assert len(candidates) == 1
+    assert "ဇာတ်ကား" in candidates[0]
+
+def test_accepts_preparsed_lxml_root():
+    html = "<div><a href='/watch'><img src='poster.jpg'><p>A long enough movie description</p></a></div>"
+    response = HtmlResponse(url="https://example.com", body=html.encode("utf-8"), encoding="utf-8")
+    assert extract_candidate_blocks(response.selector.root) == extract_candidate_blocks(html)
+
+def test_truncated_serialization_matches_full_markup_prefix():
+    html = "<div class='movie'><a href='/w?a=1&b=2'>Watch</a> &amp; more<img src='p.jpg'>" + "<p>Scene &lt;one&gt;</p>" * 300 + "</div>"
+    el = lxml.html.fromstring(html)
+    full = etree.tostring(el, encoding="unicode", method="html", with_tail=False)
+    for limit in (20, 100, 1500):
+        assert candidate_extractor._serialize_truncated(el, limit) == full[:limit]
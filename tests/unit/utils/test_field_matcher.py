@@ -192,4 +192,41 @@ def test_match_caching():
         field3, score3 = matcher.match("Movie Title")
         
         # process.extractOne should be called again
-        assert mock_process.extractOne.call_count == 2
\ No newline at end of file
+        assert mock_process.extractOne.call_count == 2
+
+def test_match_skips_labels_far_shorter_than_text():
+    """Fields whose labels are all over 8x shorter than the text are never fuzzy-scored."""
+    field_mapper = MagicMock()
+    field_mapper.get_field_patterns.return_value = {
+        "genre": {
+            "labels": ["Genre", "Type"],
+            "threshold": 70
+        }
+    }
+    matcher = FieldMatcher(field_mapper)
+    narrative = "The story follows a young teacher who returns to her home village after the war."
+
+    with patch("burmese_movies_crawler.utils.field_matcher.process") as mock_process:
+        assert matcher.match(narrative) == (None, 0)
+        mock_process.extractOne.assert_not_called()
+
+def test_match_stops_after_exact_score():
+    """Once a field scores 100, later fields are not scored since they can't beat it."""
+    field_mapper = MagicMock()
+    field_mapper.get_field_patterns.return_value = {
+        "title": {
+            "labels": ["Title", "Film Title"],
+            "threshold": 80
+        },
+        "name": {
+            "labels": ["Title", "Name"],
+            "threshold": 80
+        }
+    }
+    matcher = FieldMatcher(field_mapper)
+
+    with patch("burmese_movies_crawler.utils.field_matcher.process") as mock_process:
+        mock_process.extractOne.return_value = ("Title", 100)
+
+        assert matcher.match("Title") == ("title", 100)
+        assert mock_process.extractOne.call_count == 1
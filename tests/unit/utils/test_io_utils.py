@@ -0,0 +1,44 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from burmese_movies_crawler.utils import io_utils
+from burmese_movies_crawler.utils.io_utils import save_json
+
+
+def test_save_json_roundtrips_unicode(tmp_path):
+    path = tmp_path / "summary.json"
+    data = {"title": "ရုပ်ရှင်", "errors": [("timeout", "https://example.com")], "count": 3}
+
+    save_json(data, str(path))
+
+    raw = path.read_bytes().decode("utf-8")
+    assert "ရုပ်ရှင်" in raw  # Written as UTF-8, not \u escapes
+    assert json.loads(raw) == {"title": "ရုပ်ရှင်", "errors": [["timeout", "https://example.com"]], "count": 3}
+
+
+def test_save_json_stdlib_fallback(tmp_path, monkeypatch):
+    monkeypatch.setattr(io_utils, "orjson", None)
+    path = tmp_path / "summary.json"
+
+    save_json({"a": [1, 2]}, str(path))
+
+    assert json.loads(path.read_text(encoding="utf-8")) == {"a": [1, 2]}
+
+
+def test_save_json_non_default_indent_uses_stdlib(tmp_path):
+    path = tmp_path / "summary.json"
+
+    save_json({"a": 1}, str(path), indent=4)
+
+    assert path.read_text(encoding="utf-8") == '{\n    "a": 1\n}'
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_json_rejects_datetime(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(io_utils, "orjson", None)
+
+    with pytest.raises(TypeError):
+        save_json({"at": datetime(2024, 1, 1)}, str(tmp_path / "data.json"))
@@ -1,3 +1,5 @@
+import hashlib
+
 import pytest
 from burmese_movies_crawler.utils.link_utils import (
     is_valid_link,
@@ -8,7 +10,11 @@ from burmese_movies_crawler.utils.link_utils import (
     rule_fallback_links,
     rule_table_catalogue,
     evaluate_catalogue_rules,
-    compute_catalogue_score)
+    compute_catalogue_score,
+    get_response_or_request,
+    compile_catalogue_rules,
+    url_to_fixture_name)
+from burmese_movies_crawler.utils import link_utils
 from scrapy.http import HtmlResponse
 from urllib.parse import urldefrag, urljoin
 
@@ -73,6 +79,24 @@ def test_non_string_inputs(non_string):
     assert log[0] == ("Non-string input", non_string)
 
 
+@pytest.mark.parametrize("url, reason", [
+    ("HTTPS://Example.com/Path", None),
+    ("https://example.com/;jsessionid=abc", "Fragment-only link or base URL"),  # ;params split like urlparse
+    ("https://example.com/movies;page=2", None),
+    ("https://exa\tmple.com/", "Fragment-only link or base URL"),  # Tabs are dropped like urlparse
+    ("1http://example.com/path", "Unsupported or malformed URL format"),  # Not a valid scheme
+])
+def test_link_parsing_matches_urlparse(url, reason):
+    log = []
+    assert is_valid_link(url, log) is (reason is None)
+    assert log == ([] if reason is None else [(reason, url)])
+
+
+def test_invalid_ipv6_host_raises_like_urlparse():
+    with pytest.raises(ValueError):
+        is_valid_link("https://[::1/path")
+
+
 # Helper function to create HtmlResponse objects for testing
 def create_html_response(html_content, url="http://example.com"):
     """Create a HtmlResponse object with the given HTML content."""
@@ -441,6 +465,18 @@ class TestEvaluateCatalogueRules:
         assert results[2]['passed'] is False  # text_heavy fails with KeyError
 
 
+def test_compile_catalogue_rules_marks_table_rule():
+    """Only the table rule is called with the response."""
+    rules = [
+        ("link_heavy", rule_link_heavy, 2),
+        ("table_catalogue", rule_table_catalogue, 3),
+    ]
+    assert compile_catalogue_rules(rules) == (
+        ("link_heavy", rule_link_heavy, False, 2),
+        ("table_catalogue", rule_table_catalogue, True, 3),
+    )
+
+
 @pytest.mark.describe("compute_catalogue_score tests")
 class TestComputeCatalogueScore:
     @pytest.mark.parametrize("results, expected", [
@@ -523,4 +559,47 @@ class TestComputeCatalogueScore:
         ]
         # Default should be the same as "sum"
         assert compute_catalogue_score(results) == compute_catalogue_score(results, method="sum")
-        assert compute_catalogue_score(results, method="invalid_method") == compute_catalogue_score(results, method="sum")
\ No newline at end of file
+        assert compute_catalogue_score(results, method="invalid_method") == compute_catalogue_score(results, method="sum")
+
+
+@pytest.mark.describe("get_response_or_request tests")
+class TestGetResponseOrRequest:
+    @pytest.fixture
+    def fixture_dir(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(link_utils, "MOCK_MODE", True)
+        fixtures = tmp_path / "tests" / "fixtures"
+        fixtures.mkdir(parents=True)
+        return fixtures
+
+    def _write_fixture(self, fixture_dir, url, html):
+        hashname = url_to_fixture_name(url)
+        path = fixture_dir / f"{hashname}.html"
+        path.write_text(html, encoding="utf-8")
+        return path
+
+    def test_mock_mode_returns_fixture_response(self, fixture_dir):
+        url = "https://example.com/movies"
+        self._write_fixture(fixture_dir, url, "<html><body><p>Fixture</p></body></html>")
+
+        response = get_response_or_request(url, callback=None)
+
+        assert isinstance(response, HtmlResponse)
+        assert response.css("p::text").get() == "Fixture"
+
+    def test_mock_mode_missing_fixture(self, fixture_dir):
+        with pytest.raises(FileNotFoundError, match="MOCK_MODE"):
+            get_response_or_request("https://example.com/missing", callback=None)
+
+    def test_url_to_fixture_name_is_stable_blake2b(self):
+        url = "https://example.com/movies?page=2"
+        assert url_to_fixture_name(url) == hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+    def test_mock_mode_falls_back_to_md5_fixture(self, fixture_dir):
+        url = "https://example.com/legacy"
+        legacy_name = hashlib.md5(url.encode()).hexdigest()
+        (fixture_dir / f"{legacy_name}.html").write_text("<html><body><p>Legacy</p></body></html>", encoding="utf-8")
+
+        response = get_response_or_request(url, callback=None)
+
+        assert response.css("p::text").get() == "Legacy"
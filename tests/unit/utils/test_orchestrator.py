@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock
+
+import pytest
+from scrapy.http import HtmlResponse, Request
+
+from burmese_movies_crawler.utils.orchestrator import handle_page
+
+
+@pytest.fixture
+def extractor():
+    engine = MagicMock()
+    engine.extract_links.return_value = ["https://example.com/movie/1"]
+    engine.extract_main_fields.return_value = {"title": "Test Movie"}
+    engine.extract_paragraphs.return_value = {"director": "John Doe"}
+    return engine
+
+
+def make_classifier(kind):
+    classifier = MagicMock()
+    classifier.classify.return_value = kind
+    return classifier
+
+
+def test_catalogue_page_returns_links_and_next_page(extractor):
+    html = """
+        <html><body>
+            <a href="/movie/1">Movie</a>
+            <a class="next page-numbers" href="/page/2">Next</a>
+        </body></html>
+    """
+    result = handle_page(html, "https://example.com/movies", make_classifier("catalogue"), extractor)
+
+    assert result == {
+        "type": "catalogue",
+        "links": ["https://example.com/movie/1"],
+        "next_page": "/page/2",
+    }
+
+
+def test_catalogue_page_without_pagination(extractor):
+    html = "<html><body><a href='/movie/1'>Movie</a></body></html>"
+    result = handle_page(html, "https://example.com/movies", make_classifier("catalogue"), extractor)
+
+    assert result["next_page"] is None
+
+
+def test_detail_page_merges_main_and_paragraph_fields(extractor):
+    html = "<html><body><h1 class='entry-title'>Test Movie</h1></body></html>"
+    result = handle_page(html, "https://example.com/movie/1", make_classifier("detail"), extractor)
+
+    assert result == {"type": "detail", "item": {"title": "Test Movie", "director": "John Doe"}}
+    extractor.extract_links.assert_not_called()
+
+
+def test_unknown_page_without_candidates(extractor):
+    html = "<html><body><p>Nothing here</p></body></html>"
+    result = handle_page(html, "https://example.com/about", make_classifier("other"), extractor)
+
+    assert result == {"type": "unknown", "fallback_links": []}
+
+
+def test_reuses_scrapy_response(extractor):
+    url = "https://example.com/movie/1"
+    response = HtmlResponse(url=url, body=b"<html><body><h1>Movie</h1></body></html>",
+                            encoding="utf-8", request=Request(url=url))
+    classifier = make_classifier("detail")
+
+    handle_page(response, url, classifier, extractor)
+
+    classifier.classify.assert_called_once_with(response)
+    extractor.extract_main_fields.assert_called_once_with(response)
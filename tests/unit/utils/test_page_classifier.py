@@ -0,0 +1,158 @@
+import pytest
+from scrapy.http import HtmlResponse, Request
+
+from burmese_movies_crawler.utils.link_utils import (
+    rule_link_heavy,
+    rule_text_heavy,
+    rule_table_catalogue,
+    rule_fallback_links)
+from burmese_movies_crawler.utils.page_classifier import PageClassifier
+
+
+THRESHOLDS = {
+    'link_heavy_min_links': 50,
+    'link_heavy_max_iframes': 0,
+    'text_heavy_min_paragraphs': 50,
+    'text_heavy_max_images': 5,
+    'fallback_min_links': 30,
+    'fallback_max_images': 5,
+    'table_min_rows': 3,
+    'score_threshold': 4,
+}
+
+RULES = [
+    ("link_heavy", rule_link_heavy, 2),
+    ("text_heavy", rule_text_heavy, 2),
+    ("table_catalogue", rule_table_catalogue, 3),
+    ("fallback_links", rule_fallback_links, 1),
+]
+
+
+def create_html_response(html):
+    return HtmlResponse(url="https://example.com", body=html.encode("utf-8"), encoding="utf-8")
+
+
+@pytest.fixture
+def classifier():
+    return PageClassifier(THRESHOLDS, RULES)
+
+
+@pytest.mark.parametrize("html", [
+    # No iframe: not treated as a player page
+    "<html><body>" + "<a href='/m'>Movie</a>" * 60 + "</body></html>",
+    # Player page with a table of few rows
+    "<html><body><iframe src='/v'></iframe><table><tr><td>1</td></tr></table></body></html>",
+    # Player page with a catalogue-sized table and lots of text
+    "<html><body><iframe src='/v'></iframe><table><tbody>"
+    + "<tr><td>Movie</td></tr>" * 5 + "</tbody></table>" + "<p>Synopsis</p>" * 51
+    + "</body></html>",
+    # Empty page
+    "<html><body></body></html>",
+])
+def test_classify_matches_individual_checks(classifier, html):
+    """classify agrees with calling is_catalogue_page then is_detail_page."""
+    response = create_html_response(html)
+
+    if classifier.is_catalogue_page(response):
+        expected = "catalogue"
+    elif classifier.is_detail_page(response):
+        expected = "detail"
+    else:
+        expected = "other"
+
+    assert classifier.classify(response) == expected
+
+
+def test_classify_counts_page_once(classifier, monkeypatch):
+    """classify only extracts page stats once."""
+    from burmese_movies_crawler.utils import page_classifier
+
+    calls = []
+    original = page_classifier.extract_page_stats
+
+    def counting_stats(response):
+        calls.append(response)
+        return original(response)
+
+    monkeypatch.setattr(page_classifier, "extract_page_stats", counting_stats)
+    classifier.classify(create_html_response("<html><body><iframe src='/v'></iframe></body></html>"))
+
+    assert len(calls) == 1
+
+
+def test_page_stats_follow_the_response_object():
+    """Stats are reused for the same response but recounted for a replaced one."""
+    classifier = PageClassifier(THRESHOLDS, RULES)
+    url = "https://example.com"
+    html = "<html><body><iframe src='/v'></iframe></body></html>"
+    response = HtmlResponse(url=url, body=html.encode("utf-8"), encoding="utf-8", request=Request(url))
+
+    assert classifier.is_detail_page(response) is False
+    assert classifier._page_stats(response) is classifier._page_stats(response)
+    assert '_page_stats' not in response.meta
+
+    links = "".join(f"<a href='/m/{i}'>M</a>" for i in range(60))
+    replaced = response.replace(body=f"<html><body><iframe></iframe>{links}</body></html>".encode("utf-8"))
+    assert classifier._page_stats(replaced)['links'] == 60
+    assert classifier.is_detail_page(replaced) is True
+
+
+def test_table_rule_skipped_when_score_already_reached():
+    """Cheap rules that already reach the threshold skip the response-querying table rule."""
+    def table_rule(response, stats, thresholds):
+        pytest.fail("table rule should not run")
+
+    rules = [
+        ("table_catalogue", table_rule, 3),
+        ("link_heavy", lambda stats, thresholds: True, 2),
+        ("text_heavy", lambda stats, thresholds: True, 2),
+    ]
+    classifier = PageClassifier(THRESHOLDS, rules)
+
+    html = "<html><body><iframe src='/v'></iframe></body></html>"
+    assert classifier.classify(create_html_response(html)) == "catalogue"
+
+
+def test_rules_stop_once_threshold_is_unreachable():
+    """Remaining rules are skipped once their weights can't reach the threshold."""
+    rules = [
+        ("link_heavy", lambda stats, thresholds: False, 2),
+        ("text_heavy", lambda stats, thresholds: False, 2),
+        ("fallback_links", lambda stats, thresholds: pytest.fail("rule should not run"), 1),
+    ]
+    classifier = PageClassifier(THRESHOLDS, rules)
+
+    html = "<html><body><iframe src='/v'></iframe></body></html>"
+    assert classifier.classify(create_html_response(html)) == "other"
+
+
+def test_classify_reuses_decision_for_same_response(monkeypatch):
+    """A response classified once keeps its decision for later passes, outside request meta."""
+    from burmese_movies_crawler.utils import page_classifier
+
+    rules = [
+        ("link_heavy", lambda stats, thresholds: True, 2),
+        ("text_heavy", lambda stats, thresholds: True, 2),
+    ]
+    classifier = PageClassifier(THRESHOLDS, rules)
+
+    url = "https://example.com"
+    html = "<html><body><iframe src='/v'></iframe></body></html>"
+    response = HtmlResponse(url=url, body=html.encode("utf-8"), encoding="utf-8", request=Request(url))
+
+    assert classifier.classify(response) == "catalogue"
+    assert '_features' not in response.meta
+
+    monkeypatch.setattr(page_classifier, "extract_page_stats",
+                        lambda response: pytest.fail("page should not be reclassified"))
+    assert classifier.classify(response) == "catalogue"
+    monkeypatch.undo()
+
+    # A classifier with other thresholds doesn't reuse the decision
+    other = PageClassifier({**THRESHOLDS, 'score_threshold': 100}, rules)
+    assert other.classify(response) == "other"
+
+    # Nor does a replaced response with a different body
+    detail = response.replace(body=b"<html><body><p>Story</p></body></html>")
+    assert classifier.classify(detail) == "detail"
+
@@ -0,0 +1,158 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.common.exceptions import InvalidSessionIdException, TimeoutException, WebDriverException
+from urllib3.exceptions import MaxRetryError
+
+from burmese_movies_crawler.utils.selenium_manager import (
+    BLOCKED_URL_PATTERNS, CATALOGUE_WAIT_SELECTOR, SeleniumManager, _document_complete,
+)
+
+
+@pytest.fixture
+def chrome():
+    with patch("burmese_movies_crawler.utils.selenium_manager.webdriver.Chrome",
+               side_effect=lambda options: MagicMock()) as chrome:
+        yield chrome
+
+
+def test_render_reuses_started_driver(chrome):
+    manager = SeleniumManager(pool_size=2)
+    with patch("burmese_movies_crawler.utils.selenium_manager.WebDriverWait"):
+        manager.render("https://example.com/1")
+        manager.render("https://example.com/2")
+
+    assert chrome.call_count == 1
+
+
+def test_with_block_lends_driver_and_keeps_it_running(chrome):
+    manager = SeleniumManager(pool_size=1)
+    with patch("burmese_movies_crawler.utils.selenium_manager.WebDriverWait"):
+        with manager as driver:
+            assert manager.driver is driver
+            # Uses the lent driver instead of waiting on the empty pool
+            manager.render("https://example.com/1")
+        assert manager.driver is None
+
+        with manager as second:
+            assert second is driver
+
+    driver.quit.assert_not_called()
+    assert chrome.call_count == 1
+
+    manager.close()
+    driver.quit.assert_called_once()
+    with pytest.raises(RuntimeError):
+        manager.render("https://example.com/2")
+
+
+def test_started_driver_blocks_subresources(chrome):
+    manager = SeleniumManager()
+    with manager as driver:
+        pass
+
+    driver.execute_cdp_cmd.assert_any_call("Network.enable", {})
+    driver.execute_cdp_cmd.assert_any_call(
+        "Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
+
+@pytest.mark.parametrize("error", [
+    InvalidSessionIdException("session deleted"),
+    WebDriverException("chrome not reachable"),
+    MaxRetryError(None, "/session", "connection refused"),
+])
+def test_render_replaces_dead_driver(chrome, error):
+    manager = SeleniumManager(pool_size=1)
+    with manager as dead:
+        dead.get.side_effect = error
+
+    with patch("burmese_movies_crawler.utils.selenium_manager.WebDriverWait"):
+        page = manager.render("https://example.com/1")
+
+    dead.quit.assert_called_once()
+    assert chrome.call_count == 2
+    assert page is manager._drivers[0].page_source
+    assert manager._pool.qsize() == 1
+
+
+def test_close_wakes_threads_waiting_for_a_driver(chrome):
+    manager = SeleniumManager(pool_size=1)
+    busy = manager._checkout()
+    errors = []
+
+    def render():
+        try:
+            manager.render("https://example.com/1")
+        except RuntimeError as e:
+            errors.append(e)
+
+    waiter = threading.Thread(target=render)
+    waiter.start()
+    manager.close()
+    waiter.join(timeout=5)
+
+    assert not waiter.is_alive()
+    assert len(errors) == 1
+    busy.quit.assert_called_once()
+
+
+def test_driver_starts_outside_the_lock(chrome):
+    manager = SeleniumManager(pool_size=2)
+    first = manager._checkout()
+
+    release = threading.Event()
+    slow = MagicMock()
+
+    def slow_chrome(options):
+        release.wait(timeout=5)
+        return slow
+
+    chrome.side_effect = slow_chrome
+    errors = []
+
+    def checkout():
+        try:
+            manager._checkout()
+        except RuntimeError as e:
+            errors.append(e)
+
+    starter = threading.Thread(target=checkout)
+    starter.start()
+
+    # Neither checking a driver in nor closing waits for Chrome to start
+    for action in (lambda: manager._checkin(first), manager.close):
+        worker = threading.Thread(target=action)
+        worker.start()
+        worker.join(timeout=1)
+        assert not worker.is_alive()
+
+    release.set()
+    starter.join(timeout=5)
+
+    # The driver that finished starting after close() is quit, not handed out
+    assert len(errors) == 1
+    slow.quit.assert_called_once()
+    assert manager._starting == 0
+
+
+def test_render_waits_for_selector_or_page_load(chrome):
+    manager = SeleniumManager(pool_size=1)
+    with patch("burmese_movies_crawler.utils.selenium_manager.WebDriverWait") as wait:
+        manager.render("https://example.com/movie/1")
+        assert wait.return_value.until.call_args[0][0] is _document_complete
+
+        manager.render("https://example.com/movies/", wait_selector=CATALOGUE_WAIT_SELECTOR)
+        assert wait.return_value.until.call_args[0][0] is not _document_complete
+
+
+def test_render_does_not_replace_driver_on_page_load_timeout(chrome):
+    manager = SeleniumManager(pool_size=1)
+    with manager as slow:
+        slow.get.side_effect = TimeoutException("page load timeout")
+
+    with pytest.raises(TimeoutException):
+        manager.render("https://example.com/1")
+
+    slow.quit.assert_not_called()
+    assert chrome.call_count == 1